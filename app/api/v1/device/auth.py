@@ -7,6 +7,7 @@ Devices authenticate with serial number + signature instead of JWT.
 import hashlib
 import hmac
 import time
+from functools import lru_cache
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,20 @@ from app.core.dependencies import get_db
 from app.models.device import Device
 from app.repositories.device_repository import DeviceRepository
 
+# Signature header alphabet (hexdigest() output)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+@lru_cache(maxsize=1024)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    """
+    Return an HMAC-SHA256 object pre-keyed with the device secret.
+
+    Callers must .copy() it before update(); copying skips re-deriving
+    the inner/outer key pads on every request from the same device.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
 
 def verify_device_signature(
     serial: str,
@@ -36,24 +51,36 @@ def verify_device_signature(
     Returns:
         True if signature is valid, False otherwise
     """
+    # Timestamp must be plain ASCII digits (unix seconds); rejecting anything
+    # else up front avoids the int() exception path for malformed headers.
+    # The length bound also keeps int() under Python's digit-count limit.
+    if not (
+        len(timestamp) <= 12 and timestamp.isascii() and timestamp.isdigit()
+    ):
+        return False
+
     # Check timestamp freshness (within 5 minutes)
-    try:
-        request_time = int(timestamp)
-        current_time = int(time.time())
-        if abs(current_time - request_time) > 300:  # 5 minutes
-            return False
-    except ValueError:
+    request_time = int(timestamp)
+    current_time = int(time.time())
+    if abs(current_time - request_time) > 300:  # 5 minutes
         return False
 
     # Compute expected signature
     # Message format: "{serial}{timestamp}{body}"
-    message = f"{serial}{timestamp}{body.decode('utf-8')}".encode()
-    expected_signature = hmac.new(
-        secret.encode(), message, hashlib.sha256
-    ).hexdigest()
+    # Body is used as raw bytes: no decode/re-encode, binary payloads allowed
+    message = b"".join((serial.encode(), timestamp.encode(), body))
+    mac = _keyed_hmac(secret).copy()
+    mac.update(message)
+    expected_signature = mac.digest()
+
+    # Signature header must be the exact lowercase hex digest; fromhex() alone
+    # would also accept uppercase and whitespace-separated bytes
+    if len(signature) != 64 or not _HEX_DIGITS.issuperset(signature):
+        return False
+    provided_signature = bytes.fromhex(signature)
 
     # Constant-time comparison to prevent timing attacks
-    return hmac.compare_digest(signature, expected_signature)
+    return hmac.compare_digest(provided_signature, expected_signature)
 
 
 async def verify_device(
@@ -7,13 +7,17 @@ Supports:
 - Legacy JWT (HS256) for device authentication
 """
 
+import copy
+import functools
+import hashlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import bcrypt
 import jwt
-from jwt import PyJWKClient
+from jwt import PyJWK, PyJWKClient
 from jwt.exceptions import PyJWTError
 
 from app.core.config import settings
@@ -26,37 +30,74 @@ class ClerkJWKSClient:
 
     def __init__(self, jwks_url: str, cache_ttl: int = 3600):
         self.jwks_url = jwks_url
+        # cache_keys=True: PyJWKClient keeps parsed keys per kid itself
         self._jwk_client = PyJWKClient(jwks_url, cache_keys=True, lifespan=cache_ttl)
 
-    def get_signing_key(self, token: str):
+    def get_signing_key(self, token: str) -> PyJWK:
         """Extract kid from token and return corresponding signing key."""
         return self._jwk_client.get_signing_key_from_jwt(token)
 
 
-# Global JWKS client for Clerk
-_clerk_jwks_client: ClerkJWKSClient | None = None
+@functools.cache
+def get_clerk_jwks_client() -> ClerkJWKSClient:
+    """Get or create Clerk JWKS client singleton.
+
+    Reset with get_clerk_jwks_client.cache_clear() (a missing URL is not cached).
+    """
+    # Clerk JWKS URL format: https://<clerk-frontend-api>/.well-known/jwks.json
+    # The secret key format is sk_test_xxx or sk_live_xxx
+    # Extract the frontend API from secret key pattern or use explicit config
+
+    # Try to get JWKS URL from environment or derive from Clerk domain
+    # For now, we'll use the Clerk SDK to verify tokens
+    jwks_url = getattr(settings, 'CLERK_JWKS_URL', None)
+    if not jwks_url:
+        # Default Clerk JWKS pattern - user should set CLERK_JWKS_URL
+        # Example: https://your-app.clerk.accounts.dev/.well-known/jwks.json
+        raise ValueError(
+            "CLERK_JWKS_URL must be set. "
+            "Get it from Clerk Dashboard > API Keys > JWKS URL"
+        )
+    return ClerkJWKSClient(jwks_url, cache_ttl=3600)
 
 
-def get_clerk_jwks_client() -> ClerkJWKSClient:
-    """Get or create Clerk JWKS client singleton."""
-    global _clerk_jwks_client
-    if _clerk_jwks_client is None:
-        # Clerk JWKS URL format: https://<clerk-frontend-api>/.well-known/jwks.json
-        # The secret key format is sk_test_xxx or sk_live_xxx
-        # Extract the frontend API from secret key pattern or use explicit config
-
-        # Try to get JWKS URL from environment or derive from Clerk domain
-        # For now, we'll use the Clerk SDK to verify tokens
-        jwks_url = getattr(settings, 'CLERK_JWKS_URL', None)
-        if not jwks_url:
-            # Default Clerk JWKS pattern - user should set CLERK_JWKS_URL
-            # Example: https://your-app.clerk.accounts.dev/.well-known/jwks.json
-            raise ValueError(
-                "CLERK_JWKS_URL must be set. "
-                "Get it from Clerk Dashboard > API Keys > JWKS URL"
-            )
-        _clerk_jwks_client = ClerkJWKSClient(jwks_url, cache_ttl=3600)
-    return _clerk_jwks_client
+# Verified Clerk token cache: blake2b(token) -> (payload, expires_at).
+# The same bearer token is reused for every request in a session, so a short
+# TTL skips repeated RS256 verification. Keyed by a digest, never the raw token.
+# Only successful verifications are stored.
+VERIFY_CACHE_MAXSIZE = 10_000
+VERIFY_CACHE_TTL = 5  # seconds
+_verify_cache: dict[bytes, tuple[dict[str, Any], float]] = {}
+
+
+def _verify_cache_key(token: str) -> bytes:
+    """Derive the cache key for a token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _verify_cache_get(key: bytes, now: float) -> dict[str, Any] | None:
+    """Return a copy of the cached claims for key if still fresh."""
+    entry = _verify_cache.get(key)
+    if entry is None:
+        return None
+    payload, expires_at = entry
+    if expires_at <= now:
+        _verify_cache.pop(key, None)
+        return None
+    # Callers get their own copy so mutating claims can't poison the cache
+    return copy.deepcopy(payload)
+
+
+def _verify_cache_put(key: bytes, payload: dict[str, Any], now: float) -> None:
+    """Store verified claims, never past the token's own exp."""
+    if len(_verify_cache) >= VERIFY_CACHE_MAXSIZE:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _verify_cache.pop(next(iter(_verify_cache)), None)
+    expires_at = now + VERIFY_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    _verify_cache[key] = (copy.deepcopy(payload), expires_at)
 
 
 class ClerkAuthVerifier:
@@ -67,12 +108,20 @@ class ClerkAuthVerifier:
         """
         Verify a Clerk JWT token using JWKS.
 
+        Successful results are cached for a few seconds (see _verify_cache).
+
         Args:
             token: JWT token string from Clerk
 
         Returns:
             Decoded token payload or None if invalid
         """
+        cache_key = _verify_cache_key(token)
+        now = time.time()
+        cached = _verify_cache_get(cache_key, now)
+        if cached is not None:
+            return cached
+
         try:
             jwks_client = get_clerk_jwks_client()
             signing_key = jwks_client.get_signing_key(token)
@@ -95,6 +144,7 @@ class ClerkAuthVerifier:
                     logger.debug(f"Unauthorized party: {azp}")
                     return None
 
+            _verify_cache_put(cache_key, payload, now)
             return payload
         except PyJWTError as e:
             logger.debug(f"Token verification failed: {e}")
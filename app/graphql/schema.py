@@ -4,7 +4,9 @@ Combines all queries, mutations, and subscriptions.
 """
 
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.fastapi import GraphQLRouter
+from strawberry.types import ExecutionContext
 
 from app.graphql.context import (
     DatabaseSessionExtension,
@@ -51,12 +53,45 @@ class Mutation(DeviceMutations, ChildMutations, UserMutations):
 #     pass
 
 
-# Create Strawberry schema with database session lifecycle extension
+# Parser/validation caches skip re-parsing and re-validating identical query
+# documents, which the parent app sends repeatedly.
+GRAPHQL_CACHE_MAXSIZE = 256
+
+
+class _ParserCache(ParserCache):
+    """ParserCache with our maxsize that strawberry can construct itself."""
+
+    def __init__(
+        self, *, execution_context: ExecutionContext | None = None
+    ) -> None:
+        super().__init__(maxsize=GRAPHQL_CACHE_MAXSIZE)
+
+
+class _ValidationCache(ValidationCache):
+    """ValidationCache with our maxsize that strawberry can construct itself."""
+
+    def __init__(
+        self, *, execution_context: ExecutionContext | None = None
+    ) -> None:
+        super().__init__(maxsize=GRAPHQL_CACHE_MAXSIZE)
+
+
+# Create Strawberry schema with database session lifecycle extension.
+# The caches are registered as classes so both strawberry APIs work: the
+# locked release builds extensions once per schema with
+# ext(execution_context=None) (the instance's LRU is then shared), while newer
+# releases call ext() per request and keep the LRU at module level, keyed by
+# maxsize. Instances are deprecated there and zero-arg factories break the
+# older call signature.
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
     # subscription=Subscription,  # Uncomment when subscriptions are ready
-    extensions=[DatabaseSessionExtension],
+    extensions=[
+        DatabaseSessionExtension,
+        _ParserCache,
+        _ValidationCache,
+    ],
 )
 
 
@@ -17,7 +17,7 @@ from app.repositories.user_profile_repository import UserProfileRepository
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildResult:
     """Child operation result."""
 
@@ -20,7 +20,7 @@ from app.schemas.device import DeviceRegisterRequest, DevicePairRequest
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisterResult:
     """Device registration result."""
 
@@ -32,7 +32,7 @@ class RegisterResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PairResult:
     """Device pairing result."""
 
@@ -44,7 +44,7 @@ class PairResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnpairResult:
     """Device unpairing result."""
 
@@ -67,10 +67,11 @@ class DeviceService:
         self,
         db: AsyncSession,
         redis: Optional[Redis] = None,
+        repo: Optional[DeviceRepository] = None,
     ):
         self.db = db
         self.redis = redis
-        self.device_repo = DeviceRepository(db)
+        self.device_repo = repo if repo is not None else DeviceRepository(db)
 
     async def register(self, request: DeviceRegisterRequest) -> RegisterResult:
         """
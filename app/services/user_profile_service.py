@@ -14,7 +14,7 @@ from app.repositories.user_profile_repository import UserProfileRepository
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfileResult:
     """UserProfile operation result."""
 
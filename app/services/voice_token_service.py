@@ -33,7 +33,7 @@ RATE_LIMITS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenResult:
     """Voice token generation result."""
 
@@ -2,15 +2,20 @@
 End-to-end tests for GraphQL API.
 """
 
+import json
 import uuid
 from datetime import date, datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from app.graphql.context import GraphQLContext, get_graphql_context
 from app.graphql.schema import create_graphql_router
+from tests.helpers import FakeResult
 
 
 # Create test app with GraphQL router
@@ -24,34 +29,226 @@ def create_test_app():
 app = create_test_app()
 
 
+USER_ID = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
+
+
 def generate_mock_jwt_token(user_id: str) -> str:
     """Generate mock JWT token for testing."""
     return f"mock-jwt-token-{user_id}"
 
 
-class TestGraphQLIntrospection:
-    """Tests for GraphQL schema introspection."""
+AUTH_HEADERS = {"Authorization": f"Bearer {generate_mock_jwt_token(USER_ID)}"}
 
-    def test_introspection_query(self):
-        """Test that schema introspection works."""
-        query = """
-        {
-            __schema {
-                queryType {
-                    fields {
-                        name
-                    }
-                }
+
+def _encode(query: str, variables: dict | None = None) -> bytes:
+    """Serialize a GraphQL request body."""
+    payload = {"query": query}
+    if variables is not None:
+        payload["variables"] = variables
+    return json.dumps(payload).encode()
+
+
+# Query documents are encoded once at import; tests post the raw bytes.
+INTROSPECTION_QUERY = """
+{
+    __schema {
+        queryType {
+            fields {
+                name
             }
         }
-        """
+    }
+}
+"""
+INTROSPECTION_BODY = _encode(INTROSPECTION_QUERY)
+
+HELLO_QUERY = "{ hello }"
+HELLO_BODY = _encode(HELLO_QUERY)
+
+ME_BASIC_QUERY = """
+{
+    me {
+        id
+        email
+        name
+    }
+}
+"""
+ME_BASIC_BODY = _encode(ME_BASIC_QUERY)
+
+ME_QUERY = """
+{
+    me {
+        id
+        email
+        name
+        phone
+    }
+}
+"""
+ME_BODY = _encode(ME_QUERY)
+
+MY_CHILDREN_BASIC_QUERY = """
+{
+    myChildren {
+        id
+        name
+    }
+}
+"""
+MY_CHILDREN_BASIC_BODY = _encode(MY_CHILDREN_BASIC_QUERY)
+
+MY_CHILDREN_QUERY = """
+{
+    myChildren {
+        id
+        name
+        age
+        gender
+    }
+}
+"""
+MY_CHILDREN_BODY = _encode(MY_CHILDREN_QUERY)
+
+MY_DEVICES_BASIC_QUERY = """
+{
+    myDevices {
+        id
+        serialNumber
+    }
+}
+"""
+MY_DEVICES_BASIC_BODY = _encode(MY_DEVICES_BASIC_QUERY)
+
+MY_DEVICES_QUERY = """
+{
+    myDevices {
+        id
+        serialNumber
+        deviceType
+        firmwareVersion
+        batteryLevel
+        connectionStatus
+        childName
+    }
+}
+"""
+MY_DEVICES_BODY = _encode(MY_DEVICES_QUERY)
+
+MY_SUBSCRIPTION_BASIC_QUERY = """
+{
+    mySubscription {
+        id
+        planType
+    }
+}
+"""
+MY_SUBSCRIPTION_BASIC_BODY = _encode(MY_SUBSCRIPTION_BASIC_QUERY)
+
+MY_SUBSCRIPTION_QUERY = """
+{
+    mySubscription {
+        id
+        planType
+        status
+        autoRenew
+        isExpired
+    }
+}
+"""
+MY_SUBSCRIPTION_BODY = _encode(MY_SUBSCRIPTION_QUERY)
+
+GET_CHILD_QUERY = """
+query GetChild($id: String!) {
+    child(id: $id) {
+        id
+        name
+        age
+        gender
+    }
+}
+"""
 
+GET_CHILD_BASIC_QUERY = """
+query GetChild($id: String!) {
+    child(id: $id) {
+        id
+        name
+    }
+}
+"""
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Async HTTP client bound to the test app (no TestClient thread portal)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Content-Type": "application/json"},
+    ) as c:
+        yield c
+
+
+@pytest.fixture
+def anonymous():
+    """
+    Serve requests with an unauthenticated context.
+
+    Overrides the context dependency so no Authorization parsing or token
+    verification runs; the session factory is stubbed for the DB extension.
+    """
+    # Wrapped in a lambda: FastAPI would otherwise treat the dataclass
+    # fields as request parameters.
+    app.dependency_overrides[get_graphql_context] = lambda: GraphQLContext()
+    with patch("app.graphql.context.AsyncSessionLocal", return_value=AsyncMock()):
+        yield
+    app.dependency_overrides.pop(get_graphql_context, None)
+
+
+@pytest.fixture
+def mock_graphql_context():
+    """Patch the DB session factory and Clerk verifier used by the GraphQL context."""
+    with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
+        "app.graphql.context.clerk_auth"
+    ) as mock_clerk_auth:
+        yield MockSession, mock_clerk_auth
+
+
+@pytest.fixture
+def authed_session(mock_graphql_context):
+    """
+    Authenticate requests as USER_ID and return a DB result setter.
+
+    Usage:
+        authed_session(obj)       # result.scalar_one_or_none() -> obj
+        authed_session([a, b])    # result.scalars().all() -> [a, b]
+    """
+    MockSession, mock_clerk_auth = mock_graphql_context
+    mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": USER_ID})
+    mock_clerk_auth.get_user_id_from_payload.return_value = USER_ID
+
+    mock_db = AsyncMock()
+    MockSession.return_value = mock_db
+
+    def set_result(obj):
+        mock_db.execute.return_value = FakeResult(obj)
+        return mock_db
+
+    return set_result
+
+
+class TestGraphQLIntrospection:
+    """Tests for GraphQL schema introspection."""
+
+    @pytest.mark.asyncio
+    async def test_introspection_query(self, client):
+        """Test that schema introspection works."""
         mock_db = AsyncMock()
         with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
+            response = await client.post(
                 "/graphql",
-                json={"query": query},
+                content=INTROSPECTION_BODY,
             )
 
             assert response.status_code == 200
@@ -69,16 +266,14 @@ class TestGraphQLIntrospection:
             assert "device" in field_names
             assert "hello" in field_names
 
-    def test_hello_query(self):
+    @pytest.mark.asyncio
+    async def test_hello_query(self, client):
         """Test simple hello query."""
-        query = "{ hello }"
-
         mock_db = AsyncMock()
         with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
+            response = await client.post(
                 "/graphql",
-                json={"query": query},
+                content=HELLO_BODY,
             )
 
             assert response.status_code == 200
@@ -92,85 +287,53 @@ class TestMeQuery:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = MagicMock()
-        user.id = uuid.uuid4()
-        user.email = "test@example.com"
-        user.name = "테스트유저"
-        user.phone = "010-1234-5678"
-        user.is_active = True
-        user.email_verified = True
-        user.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        user.updated_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
-        user.children = []
-        user.subscription = None
+        user = SimpleNamespace(
+            id=uuid.uuid4(),
+            email="test@example.com",
+            name="테스트유저",
+            phone="010-1234-5678",
+            is_active=True,
+            email_verified=True,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            children=[],
+            subscription=None,
+        )
         return user
 
-    def test_me_without_auth(self):
+    @pytest.mark.asyncio
+    async def test_me_without_auth(self, client, anonymous):
         """Test me query without authentication returns null."""
-        query = """
-        {
-            me {
-                id
-                email
-                name
-            }
-        }
-        """
-
-        mock_db = AsyncMock()
-        with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["me"] is None
-
-    def test_me_with_auth(self, mock_user):
+        response = await client.post(
+            "/graphql",
+            content=ME_BASIC_BODY,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["me"] is None
+
+    @pytest.mark.asyncio
+    async def test_me_with_auth(
+        self, client, authed_session, mock_graphql_context, mock_user
+    ):
         """Test me query with authentication."""
-        query = """
-        {
-            me {
-                id
-                email
-                name
-                phone
-            }
-        }
-        """
-
-        user_id = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
-
         # Create mock profile for UserProfileService
-        mock_profile = MagicMock()
-        mock_profile.user_id = user_id
-        mock_profile.phone = "010-1234-5678"
-        mock_profile.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_profile.updated_at = None
-        mock_profile.children = []
-        mock_profile.subscription = None
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth, patch(
-            "app.graphql.queries.user.UserProfileService"
-        ) as MockProfileService:
-            # Setup JWT verification
-            mock_clerk_auth.verify_token = AsyncMock(
-                return_value={
-                    "sub": user_id,
-                    "email": "test@example.com",
-                    "first_name": "테스트",
-                    "last_name": "유저",
-                }
-            )
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
-            mock_clerk_auth.get_user_email_from_payload.return_value = "test@example.com"
-            mock_clerk_auth.get_user_name_from_payload.return_value = "테스트 유저"
-
+        mock_profile = SimpleNamespace(
+            user_id=USER_ID,
+            phone="010-1234-5678",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=None,
+            children=[],
+            subscription=None,
+        )
+
+        # Clerk claims beyond the user ID
+        _, mock_clerk_auth = mock_graphql_context
+        mock_clerk_auth.get_user_email_from_payload.return_value = "test@example.com"
+        mock_clerk_auth.get_user_name_from_payload.return_value = "테스트 유저"
+
+        with patch("app.graphql.queries.user.UserProfileService") as MockProfileService:
             # Setup UserProfileService mock
             from app.services.user_profile_service import UserProfileResult
             mock_service_instance = MagicMock()
@@ -178,23 +341,19 @@ class TestMeQuery:
                 return_value=UserProfileResult(success=True, profile=mock_profile)
             )
             MockProfileService.return_value = mock_service_instance
-
-            # Setup DB session
-            mock_db = AsyncMock()
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
+            response = await client.post(
                 "/graphql",
-                json={"query": query},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
+                content=ME_BODY,
+                headers=AUTH_HEADERS,
             )
 
             assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["me"] is not None
-            assert data["data"]["me"]["email"] == "test@example.com"
-            assert data["data"]["me"]["name"] == "테스트 유저"
+            assert response.json()["data"]["me"] == {
+                "id": USER_ID,
+                "email": "test@example.com",
+                "name": "테스트 유저",
+                "phone": "010-1234-5678",
+            }
 
 
 class TestMyChildrenQuery:
@@ -203,95 +362,64 @@ class TestMyChildrenQuery:
     @pytest.fixture
     def mock_children(self):
         """Create mock children list."""
-        child1 = MagicMock()
-        child1.id = uuid.uuid4()
-        child1.name = "첫째아이"
-        child1.birth_date = date(2019, 3, 15)
-        child1.gender = "male"
-        child1.age = 5
-        child1.is_active = True
-        child1.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child1.updated_at = None
-        child1.device = None
-
-        child2 = MagicMock()
-        child2.id = uuid.uuid4()
-        child2.name = "둘째아이"
-        child2.birth_date = date(2021, 7, 20)
-        child2.gender = "female"
-        child2.age = 3
-        child2.is_active = True
-        child2.created_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
-        child2.updated_at = None
-        child2.device = None
+        child1 = SimpleNamespace(
+            id=uuid.uuid4(),
+            name="첫째아이",
+            birth_date=date(2019, 3, 15),
+            gender="male",
+            age=5,
+            is_active=True,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=None,
+            device=None,
+        )
+
+        child2 = SimpleNamespace(
+            id=uuid.uuid4(),
+            name="둘째아이",
+            birth_date=date(2021, 7, 20),
+            gender="female",
+            age=3,
+            is_active=True,
+            created_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            updated_at=None,
+            device=None,
+        )
 
         return [child1, child2]
 
-    def test_my_children_without_auth(self):
+    @pytest.mark.asyncio
+    async def test_my_children_without_auth(self, client, anonymous):
         """Test myChildren query without authentication returns empty list."""
-        query = """
-        {
-            myChildren {
-                id
-                name
-            }
-        }
-        """
+        response = await client.post(
+            "/graphql",
+            content=MY_CHILDREN_BASIC_BODY,
+        )
 
-        mock_db = AsyncMock()
-        with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["myChildren"] == []
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["myChildren"] == []
-
-    def test_my_children_with_auth(self, mock_children):
-        """Test myChildren query with authentication."""
-        query = """
-        {
-            myChildren {
-                id
-                name
-                age
-                gender
-            }
-        }
-        """
-
-        user_id = str(uuid.uuid4())
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth:
-            mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": user_id})
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
+    @pytest.mark.asyncio
+    async def test_my_children_with_auth(self, client, authed_session, mock_children):
+        """Test myChildren query with authentication.
 
-            mock_db = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = mock_children
-            mock_db.execute.return_value = mock_result
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
-            )
+        Devices are eager-loaded with selectinload, so the whole list
+        resolves from a single execute() rather than one query per child.
+        """
+        mock_db = authed_session(mock_children)
+        response = await client.post(
+            "/graphql",
+            content=MY_CHILDREN_BODY,
+            headers=AUTH_HEADERS,
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            children = data["data"]["myChildren"]
-            assert len(children) == 2
-            assert children[0]["name"] == "첫째아이"
-            assert children[0]["age"] == 5
-            assert children[1]["name"] == "둘째아이"
-            assert children[1]["age"] == 3
+        assert response.status_code == 200
+        assert response.json()["data"]["myChildren"] == [
+            {"id": str(child.id), "name": child.name, "age": child.age, "gender": child.gender}
+            for child in mock_children
+        ]
+        mock_db.execute.assert_awaited_once()
 
 
 class TestMyDevicesQuery:
@@ -300,90 +428,56 @@ class TestMyDevicesQuery:
     @pytest.fixture
     def mock_device(self):
         """Create mock device."""
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        device.serial_number = "ABC123XYZ"
-        device.device_type = "bunny_v1"
-        device.firmware_version = "1.2.3"
-        device.battery_level = 85
-        device.connection_status = "online"
-        device.is_active = True
-        device.paired_at = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        device.child_id = uuid.uuid4()
-        device.child = MagicMock()
-        device.child.name = "테스트아이"
-        device.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        device.updated_at = None
+        device = SimpleNamespace(
+            id=uuid.uuid4(),
+            serial_number="ABC123XYZ",
+            device_type="bunny_v1",
+            firmware_version="1.2.3",
+            battery_level=85,
+            connection_status="online",
+            is_active=True,
+            paired_at=datetime(2024, 3, 1, tzinfo=timezone.utc),
+            child_id=uuid.uuid4(),
+            child=SimpleNamespace(name="테스트아이"),
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=None,
+        )
         return device
 
-    def test_my_devices_without_auth(self):
+    @pytest.mark.asyncio
+    async def test_my_devices_without_auth(self, client, anonymous):
         """Test myDevices query without authentication returns empty list."""
-        query = """
-        {
-            myDevices {
-                id
-                serialNumber
-            }
-        }
-        """
-
-        mock_db = AsyncMock()
-        with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-            )
+        response = await client.post(
+            "/graphql",
+            content=MY_DEVICES_BASIC_BODY,
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["myDevices"] == []
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["myDevices"] == []
 
-    def test_my_devices_with_auth(self, mock_device):
+    @pytest.mark.asyncio
+    async def test_my_devices_with_auth(self, client, authed_session, mock_device):
         """Test myDevices query with authentication."""
-        query = """
-        {
-            myDevices {
-                id
-                serialNumber
-                deviceType
-                firmwareVersion
-                batteryLevel
-                connectionStatus
-                childName
+        authed_session([mock_device])
+        response = await client.post(
+            "/graphql",
+            content=MY_DEVICES_BODY,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["myDevices"] == [
+            {
+                "id": str(mock_device.id),
+                "serialNumber": "ABC123XYZ",
+                "deviceType": "bunny_v1",
+                "firmwareVersion": "1.2.3",
+                "batteryLevel": 85,
+                "connectionStatus": "ONLINE",
+                "childName": "테스트아이",
             }
-        }
-        """
-
-        user_id = str(uuid.uuid4())
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth:
-            mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": user_id})
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
-
-            mock_db = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = [mock_device]
-            mock_db.execute.return_value = mock_result
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            devices = data["data"]["myDevices"]
-            assert len(devices) == 1
-            assert devices[0]["serialNumber"] == "ABC123XYZ"
-            assert devices[0]["batteryLevel"] == 85
-            assert devices[0]["connectionStatus"] == "ONLINE"
-            assert devices[0]["childName"] == "테스트아이"
+        ]
 
 
 class TestMySubscriptionQuery:
@@ -392,84 +486,49 @@ class TestMySubscriptionQuery:
     @pytest.fixture
     def mock_subscription(self):
         """Create mock subscription."""
-        sub = MagicMock()
-        sub.id = uuid.uuid4()
-        sub.plan_type = "premium"
-        sub.status = "active"
-        sub.started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        sub.expires_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        sub.auto_renew = True
-        sub.is_expired = False
-        sub.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        sub.updated_at = None
+        sub = SimpleNamespace(
+            id=uuid.uuid4(),
+            plan_type="premium",
+            status="active",
+            started_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            expires_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            auto_renew=True,
+            is_expired=False,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=None,
+        )
         return sub
 
-    def test_my_subscription_without_auth(self):
+    @pytest.mark.asyncio
+    async def test_my_subscription_without_auth(self, client, anonymous):
         """Test mySubscription query without authentication returns null."""
-        query = """
-        {
-            mySubscription {
-                id
-                planType
-            }
-        }
-        """
+        response = await client.post(
+            "/graphql",
+            content=MY_SUBSCRIPTION_BASIC_BODY,
+        )
 
-        mock_db = AsyncMock()
-        with patch("app.graphql.context.AsyncSessionLocal", return_value=mock_db):
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["mySubscription"] is None
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["mySubscription"] is None
 
-    def test_my_subscription_with_auth(self, mock_subscription):
+    @pytest.mark.asyncio
+    async def test_my_subscription_with_auth(self, client, authed_session, mock_subscription):
         """Test mySubscription query with authentication."""
-        query = """
-        {
-            mySubscription {
-                id
-                planType
-                status
-                autoRenew
-                isExpired
-            }
+        authed_session(mock_subscription)
+        response = await client.post(
+            "/graphql",
+            content=MY_SUBSCRIPTION_BODY,
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["mySubscription"] == {
+            "id": str(mock_subscription.id),
+            "planType": "PREMIUM",
+            "status": "ACTIVE",
+            "autoRenew": True,
+            "isExpired": False,
         }
-        """
-
-        user_id = str(uuid.uuid4())
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth:
-            mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": user_id})
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
-
-            mock_db = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_subscription
-            mock_db.execute.return_value = mock_result
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            subscription = data["data"]["mySubscription"]
-            assert subscription is not None
-            assert subscription["planType"] == "PREMIUM"
-            assert subscription["status"] == "ACTIVE"
-            assert subscription["autoRenew"] is True
-            assert subscription["isExpired"] is False
 
 
 class TestChildQuery:
@@ -478,92 +537,50 @@ class TestChildQuery:
     @pytest.fixture
     def mock_child(self):
         """Create mock child."""
-        child = MagicMock()
-        child.id = uuid.uuid4()
-        child.name = "개별아이"
-        child.birth_date = date(2020, 5, 10)
-        child.gender = "female"
-        child.age = 4
-        child.is_active = True
-        child.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child.updated_at = None
-        child.device = None
+        child = SimpleNamespace(
+            id=uuid.uuid4(),
+            name="개별아이",
+            birth_date=date(2020, 5, 10),
+            gender="female",
+            age=4,
+            is_active=True,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=None,
+            device=None,
+        )
         return child
 
-    def test_child_by_id(self, mock_child):
+    @pytest.mark.asyncio
+    async def test_child_by_id(self, client, authed_session, mock_child):
         """Test fetching specific child by ID."""
-        query = """
-        query GetChild($id: String!) {
-            child(id: $id) {
-                id
-                name
-                age
-                gender
-            }
-        }
-        """
-
-        user_id = str(uuid.uuid4())
         child_id = str(mock_child.id)
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth:
-            mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": user_id})
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
-
-            mock_db = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_child
-            mock_db.execute.return_value = mock_result
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query, "variables": {"id": child_id}},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            child = data["data"]["child"]
-            assert child is not None
-            assert child["name"] == "개별아이"
-            assert child["age"] == 4
-
-    def test_child_not_found(self):
-        """Test child query when child doesn't exist."""
-        query = """
-        query GetChild($id: String!) {
-            child(id: $id) {
-                id
-                name
-            }
+        authed_session(mock_child)
+        response = await client.post(
+            "/graphql",
+            content=_encode(GET_CHILD_QUERY, variables={"id": child_id}),
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["child"] == {
+            "id": child_id,
+            "name": "개별아이",
+            "age": 4,
+            "gender": "female",
         }
-        """
 
-        user_id = str(uuid.uuid4())
-
-        with patch("app.graphql.context.AsyncSessionLocal") as MockSession, patch(
-            "app.graphql.context.clerk_auth"
-        ) as mock_clerk_auth:
-            mock_clerk_auth.verify_token = AsyncMock(return_value={"sub": user_id})
-            mock_clerk_auth.get_user_id_from_payload.return_value = user_id
-
-            mock_db = AsyncMock()
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_db.execute.return_value = mock_result
-            MockSession.return_value = mock_db
-
-            client = TestClient(app)
-            response = client.post(
-                "/graphql",
-                json={"query": query, "variables": {"id": str(uuid.uuid4())}},
-                headers={"Authorization": f"Bearer {generate_mock_jwt_token(user_id)}"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["data"]["child"] is None
+    @pytest.mark.asyncio
+    async def test_child_not_found(self, client, authed_session):
+        """Test child query when child doesn't exist."""
+        authed_session(None)
+        response = await client.post(
+            "/graphql",
+            content=_encode(
+                GET_CHILD_BASIC_QUERY, variables={"id": str(uuid.uuid4())}
+            ),
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["child"] is None
@@ -0,0 +1,72 @@
+"""
+Plain test helpers (stubs and fakes) shared across test modules.
+
+Fixtures live in conftest.py; import these directly from ``tests.helpers``.
+"""
+
+import os
+import random
+import uuid
+
+
+class FakeResult:
+    """
+    Minimal stand-in for a SQLAlchemy Result.
+
+    Supports the two access patterns the code under test uses:
+    ``result.scalar_one_or_none()`` and ``result.scalars().all()``.
+    """
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._value
+
+
+class FakeSession:
+    """
+    Minimal async session whose execute() always returns the given result.
+
+    For read-only resolver tests that only call ``await db.execute(...)``.
+    """
+
+    def __init__(self, result=None):
+        self._result = result
+
+    async def execute(self, *args, **kwargs):
+        return self._result
+
+
+def aret(value):
+    """
+    Build a plain async callable that returns ``value``.
+
+    Cheaper than AsyncMock(return_value=...) for stubs whose calls are
+    never asserted on.
+    """
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+# Seeded source for test IDs: avoids an entropy syscall per uuid4(). Values
+# depend on the order of calls across the whole session (which tests are
+# collected, import order), so tests must treat them as opaque and never rely
+# on a specific ID. Set PYTEST_RANDOM_UUID=1 to get real uuid4s.
+_uuid_rng = random.Random(0)
+
+
+def fake_uuid() -> uuid.UUID:
+    """Return a pseudo-random UUID for test data."""
+    if os.getenv("PYTEST_RANDOM_UUID"):
+        return uuid.uuid4()
+    return uuid.UUID(int=_uuid_rng.getrandbits(128), version=4)
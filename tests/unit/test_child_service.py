@@ -3,72 +3,98 @@ Unit tests for ChildService.
 """
 
 from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.services.child_service import ChildService
+from tests.helpers import aret, fake_uuid
+
+# Everything here is mocked, so tests can share one event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# IDs are opaque to the mocked repository; reuse them across tests.
+USER_ID = fake_uuid()
+OTHER_USER_ID = fake_uuid()
+CHILD_ID = fake_uuid()
+
+
+def _child_lookup(owner_id):
+    """
+    Stub for ChildRepository.get_by_id_and_user.
+
+    CHILD_ID exists only for owner_id; owner_id=None means no such child.
+    """
+    child = SimpleNamespace(id=CHILD_ID, user_id=owner_id)
+
+    async def _lookup(child_id, user_id):
+        if owner_id is not None and child_id == CHILD_ID and user_id == owner_id:
+            return child
+        return None
+
+    return _lookup
+
+
+@pytest.fixture
+def mock_repo():
+    """Patch ChildRepository and yield the instance ChildService will use."""
+    with patch("app.services.child_service.ChildRepository") as MockRepo:
+        yield MockRepo.return_value
+
+
+@pytest.fixture
+def service(mock_db_session, mock_repo):
+    """ChildService wired to the mocked repository."""
+    return ChildService(mock_db_session)
 
 
 class TestCreateChild:
     """Test cases for child creation."""
 
-    @pytest.mark.asyncio
-    async def test_create_success(self, mock_db_session):
+    async def test_create_success(self, service, mock_repo):
         """Test successful child creation."""
-        user_id = uuid4()
-        mock_child = MagicMock()
-        mock_child.id = uuid4()
-        mock_child.name = "테스트"
-        mock_child.birth_date = date(2020, 1, 1)
-        mock_child.age = 5
-
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.create = AsyncMock(return_value=mock_child)
-
-            service = ChildService(mock_db_session)
-            result = await service.create_child(
-                user_id=user_id,
-                name="테스트",
-                birth_date=date(2020, 1, 1),
-            )
+        mock_child = SimpleNamespace(
+            id=CHILD_ID,
+            name="테스트",
+            birth_date=date(2020, 1, 1),
+            age=5,
+        )
+        mock_repo.create = aret(mock_child)
+
+        result = await service.create_child(
+            user_id=USER_ID,
+            name="테스트",
+            birth_date=date(2020, 1, 1),
+        )
 
         assert result.success is True
         assert result.child == mock_child
         assert result.error_code is None
 
-    @pytest.mark.asyncio
-    async def test_create_with_gender(self, mock_db_session):
+    async def test_create_with_gender(self, service, mock_repo):
         """Test child creation with gender."""
-        user_id = uuid4()
-        mock_child = MagicMock()
-        mock_child.id = uuid4()
-        mock_child.name = "테스트"
-        mock_child.gender = "male"
-
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.create = AsyncMock(return_value=mock_child)
-
-            service = ChildService(mock_db_session)
-            result = await service.create_child(
-                user_id=user_id,
-                name="테스트",
-                birth_date=date(2020, 1, 1),
-                gender="male",
-            )
+        mock_child = SimpleNamespace(
+            id=CHILD_ID,
+            name="테스트",
+            gender="male",
+        )
+        mock_repo.create = AsyncMock(return_value=mock_child)
+
+        result = await service.create_child(
+            user_id=USER_ID,
+            name="테스트",
+            birth_date=date(2020, 1, 1),
+            gender="male",
+        )
 
         assert result.success is True
         mock_repo.create.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_create_future_birthdate(self, mock_db_session):
+    async def test_create_future_birthdate(self, service):
         """Test creation fails with future birth date."""
-        service = ChildService(mock_db_session)
         result = await service.create_child(
-            user_id=uuid4(),
+            user_id=USER_ID,
             name="테스트",
             birth_date=date.today() + timedelta(days=1),
         )
@@ -81,83 +107,51 @@ class TestCreateChild:
 class TestUpdateChild:
     """Test cases for child update."""
 
-    @pytest.mark.asyncio
-    async def test_update_success(self, mock_db_session):
+    async def test_update_success(self, service, mock_repo):
         """Test successful child update."""
-        user_id = uuid4()
-        child_id = uuid4()
-        mock_child = MagicMock()
-        mock_child.id = child_id
-        mock_child.user_id = user_id
-        mock_child.name = "새이름"
-
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=mock_child)
-            mock_repo.update = AsyncMock(return_value=mock_child)
-
-            service = ChildService(mock_db_session)
-            result = await service.update_child(
-                user_id=user_id,
-                child_id=child_id,
-                name="새이름",
-            )
+        mock_child = SimpleNamespace(
+            id=CHILD_ID,
+            user_id=USER_ID,
+            name="새이름",
+        )
+        mock_repo.get_by_id_and_user = aret(mock_child)
+        mock_repo.update = aret(mock_child)
+
+        result = await service.update_child(
+            user_id=USER_ID,
+            child_id=CHILD_ID,
+            name="새이름",
+        )
 
         assert result.success is True
         assert result.child == mock_child
 
-    @pytest.mark.asyncio
-    async def test_update_child_not_found(self, mock_db_session):
-        """Test update fails when child not found."""
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=None)
-
-            service = ChildService(mock_db_session)
-            result = await service.update_child(
-                user_id=uuid4(),
-                child_id=uuid4(),
-                name="새이름",
-            )
-
-        assert result.success is False
-        assert result.error_code == "CHILD_NOT_FOUND"
-
-    @pytest.mark.asyncio
-    async def test_update_wrong_owner(self, mock_db_session):
-        """Test update fails when child belongs to different user."""
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=None)
-
-            service = ChildService(mock_db_session)
-            result = await service.update_child(
-                user_id=uuid4(),
-                child_id=uuid4(),
-                name="새이름",
-            )
+    @pytest.mark.parametrize(
+        "owner_id", [None, OTHER_USER_ID], ids=["not_found", "wrong_owner"]
+    )
+    async def test_update_missing(self, service, mock_repo, owner_id):
+        """Test update fails when child is missing or belongs to a different user."""
+        mock_repo.get_by_id_and_user = _child_lookup(owner_id)
+
+        result = await service.update_child(
+            user_id=USER_ID,
+            child_id=CHILD_ID,
+            name="새이름",
+        )
 
         assert result.success is False
         assert result.error_code == "CHILD_NOT_FOUND"
 
-    @pytest.mark.asyncio
-    async def test_update_future_birthdate(self, mock_db_session):
+    async def test_update_future_birthdate(self, service, mock_repo):
         """Test update fails with future birth date."""
-        user_id = uuid4()
-        child_id = uuid4()
-        mock_child = MagicMock()
-        mock_child.id = child_id
-
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=mock_child)
-
-            service = ChildService(mock_db_session)
-            result = await service.update_child(
-                user_id=user_id,
-                child_id=child_id,
-                birth_date=date.today() + timedelta(days=1),
-            )
+        mock_child = SimpleNamespace(id=CHILD_ID)
+        mock_repo.get_by_id_and_user = aret(mock_child)
+
+        result = await service.update_child(
+            user_id=USER_ID,
+            child_id=CHILD_ID,
+            birth_date=date.today() + timedelta(days=1),
+        )
 
         assert result.success is False
         assert result.error_code == "INVALID_BIRTH_DATE"
@@ -166,57 +160,34 @@ class TestUpdateChild:
 class TestDeleteChild:
     """Test cases for child deletion."""
 
-    @pytest.mark.asyncio
-    async def test_delete_success(self, mock_db_session):
+    async def test_delete_success(self, service, mock_repo):
         """Test successful child deletion (soft delete)."""
-        user_id = uuid4()
-        child_id = uuid4()
-        mock_child = MagicMock()
-        mock_child.id = child_id
-        mock_child.is_active = False
-
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=mock_child)
-            mock_repo.soft_delete = AsyncMock(return_value=mock_child)
-
-            service = ChildService(mock_db_session)
-            result = await service.delete_child(
-                user_id=user_id,
-                child_id=child_id,
-            )
+        mock_child = SimpleNamespace(
+            id=CHILD_ID,
+            is_active=False,
+        )
+        mock_repo.get_by_id_and_user = aret(mock_child)
+        mock_repo.soft_delete = AsyncMock(return_value=mock_child)
+
+        result = await service.delete_child(
+            user_id=USER_ID,
+            child_id=CHILD_ID,
+        )
 
         assert result.success is True
         mock_repo.soft_delete.assert_called_once_with(mock_child)
 
-    @pytest.mark.asyncio
-    async def test_delete_child_not_found(self, mock_db_session):
-        """Test delete fails when child not found."""
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=None)
+    @pytest.mark.parametrize(
+        "owner_id", [None, OTHER_USER_ID], ids=["not_found", "wrong_owner"]
+    )
+    async def test_delete_missing(self, service, mock_repo, owner_id):
+        """Test delete fails when child is missing or belongs to a different user."""
+        mock_repo.get_by_id_and_user = _child_lookup(owner_id)
 
-            service = ChildService(mock_db_session)
-            result = await service.delete_child(
-                user_id=uuid4(),
-                child_id=uuid4(),
-            )
-
-        assert result.success is False
-        assert result.error_code == "CHILD_NOT_FOUND"
-
-    @pytest.mark.asyncio
-    async def test_delete_wrong_owner(self, mock_db_session):
-        """Test delete fails when child belongs to different user."""
-        with patch("app.services.child_service.ChildRepository") as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id_and_user = AsyncMock(return_value=None)
-
-            service = ChildService(mock_db_session)
-            result = await service.delete_child(
-                user_id=uuid4(),
-                child_id=uuid4(),
-            )
+        result = await service.delete_child(
+            user_id=USER_ID,
+            child_id=CHILD_ID,
+        )
 
         assert result.success is False
         assert result.error_code == "CHILD_NOT_FOUND"
@@ -7,19 +7,28 @@ from unittest.mock import MagicMock, patch
 import jwt
 import pytest
 
+import app.core.security as security_module
 from app.core.security import ClerkJWKSClient, ClerkAuthVerifier, get_clerk_jwks_client
 
 
+@pytest.fixture(scope="module")
+def jwks_client():
+    # Read-only in these tests (patch.object restores the attribute)
+    return ClerkJWKSClient(
+        jwks_url="https://test.clerk.accounts.dev/.well-known/jwks.json",
+        cache_ttl=3600,
+    )
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    # Stateless; per-test patches are function-scoped
+    return ClerkAuthVerifier()
+
+
 class TestClerkJWKSClient:
     """Tests for Clerk JWKS client."""
 
-    @pytest.fixture
-    def jwks_client(self):
-        return ClerkJWKSClient(
-            jwks_url="https://test.clerk.accounts.dev/.well-known/jwks.json",
-            cache_ttl=3600,
-        )
-
     def test_jwks_client_initializes_pyjwk_client(self, jwks_client):
         """JWKS client should initialize PyJWKClient internally."""
         assert jwks_client._jwk_client is not None
@@ -41,9 +50,12 @@ class TestClerkJWKSClient:
 class TestClerkAuthVerifier:
     """Tests for Clerk JWT verification."""
 
-    @pytest.fixture
-    def verifier(self):
-        return ClerkAuthVerifier()
+    @pytest.fixture(autouse=True)
+    def clear_verify_cache(self):
+        """Keep verified-token cache entries from leaking between tests."""
+        security_module._verify_cache.clear()
+        yield
+        security_module._verify_cache.clear()
 
     @pytest.fixture
     def valid_payload(self):
@@ -129,21 +141,70 @@ class TestClerkAuthVerifier:
                     result = await verifier.verify_token("valid-token")
                     assert result is None
 
+    @pytest.mark.asyncio
+    async def test_verify_token_cached(self, verifier, valid_payload):
+        """Repeat verification of the same token should skip jwt.decode."""
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = "mock-key"
+
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key.return_value = mock_signing_key
+
+        with patch("app.core.security.get_clerk_jwks_client", return_value=mock_jwks_client):
+            with patch.object(jwt, "decode", return_value=valid_payload) as mock_decode:
+                first = await verifier.verify_token("valid-token")
+                second = await verifier.verify_token("valid-token")
+
+        assert first == second == valid_payload
+        mock_decode.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cache_isolated_from_callers(self, verifier, valid_payload):
+        """Mutating returned claims must not change later cache hits."""
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key.return_value = MagicMock(key="mock-key")
+
+        with patch("app.core.security.get_clerk_jwks_client", return_value=mock_jwks_client):
+            with patch.object(jwt, "decode", return_value=dict(valid_payload)):
+                first = await verifier.verify_token("valid-token")
+                first["sub"] = "user_tampered"
+                second = await verifier.verify_token("valid-token")
+                second["email"] = "tampered@example.com"
+                third = await verifier.verify_token("valid-token")
+
+        assert third == valid_payload
+
+    @pytest.mark.asyncio
+    async def test_verify_token_does_not_cache_failures(self, verifier):
+        """Failed verification should be retried on the next call."""
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key.return_value = MagicMock(key="mock-key")
+
+        with patch("app.core.security.get_clerk_jwks_client", return_value=mock_jwks_client):
+            with patch.object(
+                jwt, "decode", side_effect=jwt.InvalidTokenError("bad")
+            ) as mock_decode:
+                assert await verifier.verify_token("bad-token") is None
+                assert await verifier.verify_token("bad-token") is None
+
+        assert mock_decode.call_count == 2
+
 
 class TestGetClerkJwksClient:
     """Tests for Clerk JWKS client singleton."""
 
     def test_returns_same_instance(self):
         """Should return same client instance."""
-        # Reset singleton
-        import app.core.security as security_module
-
-        security_module._clerk_jwks_client = None
+        get_clerk_jwks_client.cache_clear()
 
         client1 = get_clerk_jwks_client()
         client2 = get_clerk_jwks_client()
 
         assert client1 is client2
 
+        # cache_clear() drops the singleton
+        get_clerk_jwks_client.cache_clear()
+        assert get_clerk_jwks_client() is not client1
+
         # Cleanup
-        security_module._clerk_jwks_client = None
+        get_clerk_jwks_client.cache_clear()
@@ -4,13 +4,24 @@ Unit tests for device HMAC authentication.
 
 import hashlib
 import hmac
+import inspect
+import re
 import time
+from functools import lru_cache
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.api.v1.device import auth as device_auth
 from app.api.v1.device.auth import verify_device_signature
 
 
+@lru_cache(maxsize=None)
+def _prekeyed(secret: str) -> "hmac.HMAC":
+    """Pre-keyed HMAC per secret; generate_signature copies it."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
 class TestVerifyDeviceSignature:
     """Tests for HMAC signature verification."""
 
@@ -32,8 +43,10 @@ class TestVerifyDeviceSignature:
         secret: str,
     ) -> str:
         """Generate valid HMAC signature for testing."""
-        message = f"{serial}{timestamp}{body.decode('utf-8')}".encode()
-        return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+        message = b"".join((serial.encode(), timestamp.encode(), body))
+        mac = _prekeyed(secret).copy()
+        mac.update(message)
+        return mac.hexdigest()
 
     def test_valid_signature(self, serial_number, device_secret):
         """Test valid signature verification."""
@@ -71,6 +84,24 @@ class TestVerifyDeviceSignature:
 
         assert result is True
 
+    def test_valid_signature_binary_body(self, serial_number, device_secret):
+        """Test valid signature with a non-UTF-8 body."""
+        timestamp = str(int(time.time()))
+        body = bytes(range(256))
+        signature = self.generate_signature(
+            serial_number, timestamp, body, device_secret
+        )
+
+        result = verify_device_signature(
+            serial=serial_number,
+            signature=signature,
+            timestamp=timestamp,
+            body=body,
+            secret=device_secret,
+        )
+
+        assert result is True
+
     def test_invalid_signature(self, serial_number, device_secret):
         """Test invalid signature detection."""
         timestamp = str(int(time.time()))
@@ -192,6 +223,47 @@ class TestVerifyDeviceSignature:
 
         assert result is False
 
+    @pytest.mark.parametrize(
+        "timestamp",
+        ["", "-1", "+1700000000", " 1700000000", "1.5", "²", "1" * 5000],
+    )
+    def test_non_digit_timestamp_rejected(self, serial_number, device_secret, timestamp):
+        """Test timestamps that are not short plain ASCII digits are rejected."""
+        result = verify_device_signature(
+            serial=serial_number,
+            signature="any-signature",
+            timestamp=timestamp,
+            body=b"",
+            secret=device_secret,
+        )
+
+        assert result is False
+
+    @pytest.mark.parametrize(
+        "transform",
+        [str.upper, lambda s: " ".join(s[i : i + 2] for i in range(0, 64, 2))],
+        ids=["uppercase", "spaced"],
+    )
+    def test_non_canonical_signature_rejected(
+        self, serial_number, device_secret, transform
+    ):
+        """Test only the exact lowercase hex digest is accepted."""
+        timestamp = str(int(time.time()))
+        body = b'{"test": "data"}'
+        signature = self.generate_signature(
+            serial_number, timestamp, body, device_secret
+        )
+
+        result = verify_device_signature(
+            serial=serial_number,
+            signature=transform(signature),
+            timestamp=timestamp,
+            body=body,
+            secret=device_secret,
+        )
+
+        assert result is False
+
     def test_different_serial_numbers(self, device_secret):
         """Test signature is specific to serial number."""
         timestamp = str(int(time.time()))
@@ -210,3 +282,49 @@ class TestVerifyDeviceSignature:
         )
 
         assert result is False
+
+    @pytest.mark.parametrize("valid", [True, False])
+    def test_constant_time_comparison(self, serial_number, device_secret, valid):
+        """Both match and mismatch paths go through hmac.compare_digest."""
+        timestamp = str(int(time.time()))
+        body = b'{"test": "data"}'
+        signature = self.generate_signature(
+            serial_number, timestamp, body, device_secret
+        )
+        if not valid:
+            signature = "0" * len(signature)
+
+        spy = MagicMock(wraps=hmac.compare_digest)
+        with patch.object(device_auth.hmac, "compare_digest", spy):
+            result = verify_device_signature(
+                serial=serial_number,
+                signature=signature,
+                timestamp=timestamp,
+                body=body,
+                secret=device_secret,
+            )
+
+        assert result is valid
+        spy.assert_called_once()
+
+    def test_no_plain_equality_on_signature(self):
+        """Guard against reintroducing a short-circuiting == on signatures."""
+        source = inspect.getsource(device_auth)
+        assert not re.search(r"signature\w*\s*[=!]=|[=!]=\s*\w*signature", source)
+
+    def test_prekeyed_hmac_is_not_mutated(self, serial_number, device_secret):
+        """Repeated verifications must not accumulate state in the cached HMAC."""
+        timestamp = str(int(time.time()))
+        body = b'{"test": "data"}'
+        signature = self.generate_signature(
+            serial_number, timestamp, body, device_secret
+        )
+
+        for _ in range(3):
+            assert verify_device_signature(
+                serial=serial_number,
+                signature=signature,
+                timestamp=timestamp,
+                body=body,
+                secret=device_secret,
+            ) is True
@@ -3,13 +3,25 @@ Unit tests for DeviceService.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.schemas.device import DevicePairRequest, DeviceRegisterRequest
 from app.services.device_service import DeviceService
+from tests.helpers import FakeResult, aret, fake_uuid
+
+
+@pytest.fixture(scope="module")
+def mock_child():
+    """Create mock child (shared; tests treat it as read-only)."""
+    return SimpleNamespace(
+        id=fake_uuid(),
+        name="테스트 아이",
+        user_id=fake_uuid(),
+        is_active=True,
+    )
 
 
 class TestDeviceRegistration:
@@ -33,22 +45,17 @@ class TestDeviceRegistration:
     @pytest.mark.asyncio
     async def test_register_success(self, mock_db_session, register_request):
         """Test successful device registration."""
-        device_id = uuid4()
+        device_id = fake_uuid()
         mock_device = MagicMock()
         mock_device.id = device_id
         mock_device.serial_number = register_request.serial_number
 
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.exists_by_serial = AsyncMock(return_value=False)
-            mock_repo.create = AsyncMock(
-                return_value=(mock_device, "generated-secret-123")
-            )
+        mock_repo = MagicMock()
+        mock_repo.exists_by_serial = aret(False)
+        mock_repo.create = aret((mock_device, "generated-secret-123"))
 
-            service = DeviceService(mock_db_session)
-            result = await service.register(register_request)
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.register(register_request)
 
         assert result.success is True
         assert result.device_id == str(device_id)
@@ -58,14 +65,11 @@ class TestDeviceRegistration:
     @pytest.mark.asyncio
     async def test_register_duplicate_serial(self, mock_db_session, register_request):
         """Test registration fails for duplicate serial number."""
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.exists_by_serial = AsyncMock(return_value=True)
+        mock_repo = MagicMock()
+        mock_repo.exists_by_serial = aret(True)
 
-            service = DeviceService(mock_db_session)
-            result = await service.register(register_request)
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.register(register_request)
 
         assert result.success is False
         assert result.error_code == "SERIAL_NUMBER_EXISTS"
@@ -79,21 +83,12 @@ class TestDevicePairing:
     def mock_device(self):
         """Create mock device."""
         device = MagicMock()
-        device.id = uuid4()
+        device.id = fake_uuid()
         device.serial_number = "ABC123XYZ"
         device.child_id = None
         device.paired_at = None
         return device
 
-    @pytest.fixture
-    def mock_child(self):
-        """Create mock child."""
-        child = MagicMock()
-        child.id = uuid4()
-        child.name = "테스트 아이"
-        child.is_active = True
-        return child
-
     @pytest.fixture
     def pair_request(self):
         """Sample pairing request."""
@@ -105,7 +100,7 @@ class TestDevicePairing:
     ):
         """Test successful device pairing."""
         child_id_str = str(mock_child.id)
-        mock_redis_client.get = AsyncMock(return_value=child_id_str.encode())
+        mock_redis_client.get = aret(child_id_str.encode())
         mock_redis_client.delete = AsyncMock()
 
         paired_device = MagicMock()
@@ -113,19 +108,14 @@ class TestDevicePairing:
         paired_device.paired_at = datetime.now(timezone.utc)
 
         # Mock the result of db.execute for child query
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=mock_child)
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.execute = aret(FakeResult(mock_child))
 
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_child_id = AsyncMock(return_value=None)
-            mock_repo.pair_with_child = AsyncMock(return_value=paired_device)
+        mock_repo = MagicMock()
+        mock_repo.get_by_child_id = aret(None)
+        mock_repo.pair_with_child = aret(paired_device)
 
-            service = DeviceService(mock_db_session, mock_redis_client)
-            result = await service.pair(mock_device, pair_request)
+        service = DeviceService(mock_db_session, mock_redis_client, repo=mock_repo)
+        result = await service.pair(mock_device, pair_request)
 
         assert result.success is True
         assert result.child_id == child_id_str
@@ -138,7 +128,7 @@ class TestDevicePairing:
     ):
         """Test pairing fails when device is already paired."""
         device = MagicMock()
-        device.child_id = uuid4()  # Already paired
+        device.child_id = fake_uuid()  # Already paired
 
         service = DeviceService(mock_db_session, mock_redis_client)
         result = await service.pair(device, pair_request)
@@ -151,7 +141,7 @@ class TestDevicePairing:
         self, mock_db_session, mock_redis_client, mock_device, pair_request
     ):
         """Test pairing fails with invalid code."""
-        mock_redis_client.get = AsyncMock(return_value=None)  # Code not found
+        mock_redis_client.get = aret(None)  # Code not found
 
         service = DeviceService(mock_db_session, mock_redis_client)
         result = await service.pair(mock_device, pair_request)
@@ -176,18 +166,15 @@ class TestDeviceUnpairing:
     async def test_unpair_success(self, mock_db_session):
         """Test successful device unpairing."""
         device = MagicMock()
-        device.id = uuid4()
+        device.id = fake_uuid()
         device.serial_number = "ABC123XYZ"
-        device.child_id = uuid4()  # Currently paired
+        device.child_id = fake_uuid()  # Currently paired
 
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.unpair = AsyncMock(return_value=device)
+        mock_repo = MagicMock()
+        mock_repo.unpair = aret(device)
 
-            service = DeviceService(mock_db_session)
-            result = await service.unpair(device)
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.unpair(device)
 
         assert result.success is True
         assert result.error_code is None
@@ -208,16 +195,6 @@ class TestDeviceUnpairing:
 class TestRegisterAndPair:
     """Test cases for register_and_pair (GraphQL/BLE flow)."""
 
-    @pytest.fixture
-    def mock_child(self):
-        """Create mock child."""
-        child = MagicMock()
-        child.id = uuid4()
-        child.name = "테스트 아이"
-        child.user_id = uuid4()
-        child.is_active = True
-        return child
-
     @pytest.mark.asyncio
     async def test_register_and_pair_success(self, mock_db_session, mock_child):
         """Test successful device registration and pairing."""
@@ -225,37 +202,32 @@ class TestRegisterAndPair:
         child_id = mock_child.id
 
         mock_device = MagicMock()
-        mock_device.id = uuid4()
+        mock_device.id = fake_uuid()
         mock_device.serial_number = "AA:BB:CC:DD:EE:FF"
         mock_device.child_id = child_id
         mock_device.child = mock_child
         mock_device.paired_at = datetime.now(timezone.utc)
 
         # Mock child query
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=mock_child)
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.execute = aret(FakeResult(mock_child))
         mock_db_session.add = MagicMock()
         mock_db_session.flush = AsyncMock()
         mock_db_session.refresh = AsyncMock()
 
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_serial_number = AsyncMock(return_value=None)
-            mock_repo.get_by_child_id = AsyncMock(return_value=None)
-            mock_repo.pair_with_child = AsyncMock(return_value=mock_device)
-
-            service = DeviceService(mock_db_session)
-            result = await service.register_and_pair(
-                user_id=user_id,
-                serial_number="AA:BB:CC:DD:EE:FF",
-                device_secret="test-secret",
-                device_type="plush_v1",
-                firmware_version="1.0.0",
-                child_id=child_id,
-            )
+        mock_repo = MagicMock()
+        mock_repo.get_by_serial_number = aret(None)
+        mock_repo.get_by_child_id = aret(None)
+        mock_repo.pair_with_child = aret(mock_device)
+
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.register_and_pair(
+            user_id=user_id,
+            serial_number="AA:BB:CC:DD:EE:FF",
+            device_secret="test-secret",
+            device_type="plush_v1",
+            firmware_version="1.0.0",
+            child_id=child_id,
+        )
 
         assert result.success is True
         assert result.device is not None
@@ -264,24 +236,21 @@ class TestRegisterAndPair:
     @pytest.mark.asyncio
     async def test_register_and_pair_child_not_found(self, mock_db_session):
         """Test fails when child not found or not owned by user."""
-        user_id = uuid4()
-        child_id = uuid4()
+        user_id = fake_uuid()
+        child_id = fake_uuid()
 
         # Mock child query returns None
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch("app.services.device_service.DeviceRepository"):
-            service = DeviceService(mock_db_session)
-            result = await service.register_and_pair(
-                user_id=user_id,
-                serial_number="AA:BB:CC:DD:EE:FF",
-                device_secret="test-secret",
-                device_type="plush_v1",
-                firmware_version="1.0.0",
-                child_id=child_id,
-            )
+        mock_db_session.execute = aret(FakeResult(None))
+
+        service = DeviceService(mock_db_session, repo=MagicMock())
+        result = await service.register_and_pair(
+            user_id=user_id,
+            serial_number="AA:BB:CC:DD:EE:FF",
+            device_secret="test-secret",
+            device_type="plush_v1",
+            firmware_version="1.0.0",
+            child_id=child_id,
+        )
 
         assert result.success is False
         assert result.error_code == "CHILD_NOT_FOUND"
@@ -298,25 +267,20 @@ class TestRegisterAndPair:
         existing_device.device_secret = "different-secret"
 
         # Mock child query
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=mock_child)
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_serial_number = AsyncMock(return_value=existing_device)
-
-            service = DeviceService(mock_db_session)
-            result = await service.register_and_pair(
-                user_id=user_id,
-                serial_number="AA:BB:CC:DD:EE:FF",
-                device_secret="test-secret",
-                device_type="plush_v1",
-                firmware_version="1.0.0",
-                child_id=child_id,
-            )
+        mock_db_session.execute = aret(FakeResult(mock_child))
+
+        mock_repo = MagicMock()
+        mock_repo.get_by_serial_number = aret(existing_device)
+
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.register_and_pair(
+            user_id=user_id,
+            serial_number="AA:BB:CC:DD:EE:FF",
+            device_secret="test-secret",
+            device_type="plush_v1",
+            firmware_version="1.0.0",
+            child_id=child_id,
+        )
 
         assert result.success is False
         assert result.error_code == "SERIAL_NUMBER_EXISTS"
@@ -325,20 +289,11 @@ class TestRegisterAndPair:
 class TestUnpairById:
     """Test cases for unpair_by_id (GraphQL flow)."""
 
-    @pytest.fixture
-    def mock_child(self):
-        """Create mock child."""
-        child = MagicMock()
-        child.id = uuid4()
-        child.user_id = uuid4()
-        child.is_active = True
-        return child
-
     @pytest.mark.asyncio
     async def test_unpair_by_id_success(self, mock_db_session, mock_child):
         """Test successful unpair by ID."""
         user_id = mock_child.user_id
-        device_id = uuid4()
+        device_id = fake_uuid()
 
         mock_device = MagicMock()
         mock_device.id = device_id
@@ -346,39 +301,31 @@ class TestUnpairById:
         mock_device.child_id = mock_child.id
 
         # Mock child query
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=mock_child)
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id = AsyncMock(return_value=mock_device)
-            mock_repo.unpair = AsyncMock(return_value=mock_device)
-
-            service = DeviceService(mock_db_session)
-            result = await service.unpair_by_id(
-                user_id=user_id,
-                device_id=device_id,
-            )
+        mock_db_session.execute = aret(FakeResult(mock_child))
+
+        mock_repo = MagicMock()
+        mock_repo.get_by_id = aret(mock_device)
+        mock_repo.unpair = aret(mock_device)
+
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.unpair_by_id(
+            user_id=user_id,
+            device_id=device_id,
+        )
 
         assert result.success is True
 
     @pytest.mark.asyncio
     async def test_unpair_by_id_device_not_found(self, mock_db_session):
         """Test fails when device not found."""
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id = AsyncMock(return_value=None)
-
-            service = DeviceService(mock_db_session)
-            result = await service.unpair_by_id(
-                user_id=uuid4(),
-                device_id=uuid4(),
-            )
+        mock_repo = MagicMock()
+        mock_repo.get_by_id = aret(None)
+
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.unpair_by_id(
+            user_id=fake_uuid(),
+            device_id=fake_uuid(),
+        )
 
         assert result.success is False
         assert result.error_code == "DEVICE_NOT_FOUND"
@@ -389,17 +336,14 @@ class TestUnpairById:
         mock_device = MagicMock()
         mock_device.child_id = None  # Not paired
 
-        with patch(
-            "app.services.device_service.DeviceRepository"
-        ) as MockRepo:
-            mock_repo = MockRepo.return_value
-            mock_repo.get_by_id = AsyncMock(return_value=mock_device)
-
-            service = DeviceService(mock_db_session)
-            result = await service.unpair_by_id(
-                user_id=uuid4(),
-                device_id=uuid4(),
-            )
+        mock_repo = MagicMock()
+        mock_repo.get_by_id = aret(mock_device)
+
+        service = DeviceService(mock_db_session, repo=mock_repo)
+        result = await service.unpair_by_id(
+            user_id=fake_uuid(),
+            device_id=fake_uuid(),
+        )
 
         assert result.success is False
         assert result.error_code == "NOT_PAIRED"
@@ -2,9 +2,11 @@
 Unit tests for GraphQL query resolvers.
 """
 
-import uuid
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -15,414 +17,352 @@ from app.graphql.queries.user import (
     _convert_profile_to_user_type,
 )
 from app.graphql.queries.device import DeviceQueries, _convert_device_to_type
+from app.services.user_profile_service import UserProfileResult
+from tests.helpers import FakeResult, FakeSession, fake_uuid
+
+
+@dataclass
+class FakeContext:
+    """GraphQLContext stand-in; resolvers only read these attributes."""
+
+    user_id: Optional[str] = None
+    user_email: Optional[str] = None
+    user_name: Optional[str] = None
+    db: Any = None
+
+
+@dataclass
+class FakeInfo:
+    """strawberry Info stand-in; resolvers only read .context."""
+
+    context: FakeContext
+
+
+# Shared literals; tests compare by value, so one instance per module is enough.
+_USER_ID = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
+_CHILD_ID = fake_uuid()
+_DEVICE_ID = fake_uuid()
+_SUBSCRIPTION_ID = fake_uuid()
+_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_UPDATED_AT = datetime(2024, 6, 1, tzinfo=timezone.utc)
+_PAIRED_AT = datetime(2024, 2, 1, tzinfo=timezone.utc)
+_EXPIRES_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Resolver classes hold no state; one instance serves every test.
+_USER_QUERIES = UserQueries()
+_DEVICE_QUERIES = DeviceQueries()
+
+
+@pytest.fixture
+def user_profile_service_mock(monkeypatch):
+    """Replace UserProfileService in the user resolvers; returns the mock class."""
+    service_cls = MagicMock()
+    service_cls.return_value.get_or_create_profile = AsyncMock()
+    monkeypatch.setattr("app.graphql.queries.user.UserProfileService", service_cls)
+    return service_cls
+
+
+def _make_profile(**overrides) -> SimpleNamespace:
+    """Build a UserProfile stand-in; converters only read attributes."""
+    fields = {
+        "user_id": _USER_ID,
+        "phone": "010-1234-5678",
+        "created_at": _CREATED_AT,
+        "updated_at": _UPDATED_AT,
+        "children": [],
+        "subscription": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _make_child(**overrides) -> SimpleNamespace:
+    """Build a Child stand-in."""
+    fields = {
+        "id": _CHILD_ID,
+        "name": "홍아이",
+        "birth_date": date(2020, 5, 15),
+        "gender": "male",
+        "age": 4,
+        "is_active": True,
+        "created_at": _CREATED_AT,
+        "updated_at": None,
+        "device": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _make_device(**overrides) -> SimpleNamespace:
+    """Build a Device stand-in."""
+    fields = {
+        "id": _DEVICE_ID,
+        "serial_number": "DEV001",
+        "device_type": "bunny_v1",
+        "firmware_version": "1.0.0",
+        "battery_level": 90,
+        "connection_status": "online",
+        "is_active": True,
+        "paired_at": _PAIRED_AT,
+        "child_id": _CHILD_ID,
+        "child": None,
+        "created_at": _CREATED_AT,
+        "updated_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _make_subscription(**overrides) -> SimpleNamespace:
+    """Build a Subscription stand-in."""
+    fields = {
+        "id": _SUBSCRIPTION_ID,
+        "plan_type": "premium",
+        "status": "active",
+        "started_at": _CREATED_AT,
+        "expires_at": _EXPIRES_AT,
+        "auto_renew": True,
+        "is_expired": False,
+        "created_at": _CREATED_AT,
+        "updated_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
 
 
 class TestConvertProfileToUserType:
     """Tests for _convert_profile_to_user_type function."""
 
-    @pytest.fixture
-    def mock_profile(self):
-        """Create mock user profile model."""
-        profile = MagicMock()
-        profile.user_id = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
-        profile.phone = "010-1234-5678"
-        profile.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        profile.updated_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
-        profile.children = []
-        profile.subscription = None
-        return profile
-
-    def test_convert_profile_basic(self, mock_profile):
-        """Test basic profile conversion."""
+    @pytest.mark.parametrize(
+        "children,subscription",
+        [
+            ([], None),
+            ([_make_child(gender="female")], None),
+            ([], _make_subscription()),
+        ],
+        ids=["basic", "with_children", "with_subscription"],
+    )
+    def test_convert_profile(self, children, subscription):
+        """Test profile conversion with optional children and subscription."""
+        profile = _make_profile(children=children, subscription=subscription)
+
         result = _convert_profile_to_user_type(
-            profile=mock_profile,
+            profile=profile,
             email="parent@example.com",
             name="홍길동",
         )
 
-        assert result.id == mock_profile.user_id
+        assert result.id == profile.user_id
         assert result.email == "parent@example.com"
         assert result.name == "홍길동"
         assert result.phone == "010-1234-5678"
-        assert result.children == []
-        assert result.subscription is None
-
-    def test_convert_profile_with_children(self, mock_profile):
-        """Test profile conversion with children."""
-        child = MagicMock()
-        child.id = uuid.uuid4()
-        child.name = "홍아이"
-        child.birth_date = date(2020, 5, 15)
-        child.gender = "female"
-        child.age = 4
-        child.is_active = True
-        child.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child.updated_at = None
-        child.device = None
-
-        mock_profile.children = [child]
-
-        result = _convert_profile_to_user_type(
-            profile=mock_profile,
-            email="parent@example.com",
-        )
-
-        assert len(result.children) == 1
-        assert result.children[0].name == "홍아이"
-        assert result.children[0].age == 4
-
-    def test_convert_profile_with_subscription(self, mock_profile):
-        """Test profile conversion with subscription."""
-        subscription = MagicMock()
-        subscription.id = uuid.uuid4()
-        subscription.plan_type = "premium"
-        subscription.status = "active"
-        subscription.started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        subscription.expires_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        subscription.auto_renew = True
-        subscription.is_expired = False
-        subscription.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        subscription.updated_at = None
-
-        mock_profile.subscription = subscription
-
-        result = _convert_profile_to_user_type(
-            profile=mock_profile,
-            email="parent@example.com",
-        )
-
-        assert result.subscription is not None
-        assert result.subscription.plan_type.value == "premium"
-        assert result.subscription.auto_renew is True
+        assert [(c.name, c.age) for c in result.children] == [
+            (c.name, c.age) for c in children
+        ]
+        if subscription is None:
+            assert result.subscription is None
+        else:
+            assert result.subscription.plan_type.value == "premium"
+            assert result.subscription.auto_renew is True
 
 
 class TestConvertChildToType:
     """Tests for _convert_child_to_type function."""
 
-    @pytest.fixture
-    def mock_child(self):
-        """Create mock child model."""
-        child = MagicMock()
-        child.id = uuid.uuid4()
-        child.name = "홍아이"
-        child.birth_date = date(2020, 5, 15)
-        child.gender = "male"
-        child.age = 4
-        child.is_active = True
-        child.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child.updated_at = None
-        child.device = None
-        return child
-
-    def test_convert_child_basic(self, mock_child):
-        """Test basic child conversion."""
-        result = _convert_child_to_type(mock_child)
-
-        assert result.id == str(mock_child.id)
+    @pytest.mark.parametrize(
+        "device",
+        [
+            None,
+            _make_device(serial_number="ABC123", battery_level=85),
+        ],
+        ids=["basic", "with_device"],
+    )
+    def test_convert_child(self, device):
+        """Test child conversion with and without a paired device."""
+        child = _make_child(device=device)
+
+        result = _convert_child_to_type(child)
+
+        assert result.id == str(child.id)
         assert result.name == "홍아이"
         assert result.birth_date == date(2020, 5, 15)
         assert result.gender == "male"
         assert result.age == 4
         assert result.is_active is True
-        assert result.device is None
-
-    def test_convert_child_with_device(self, mock_child):
-        """Test child conversion with paired device."""
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        device.serial_number = "ABC123"
-        device.device_type = "bunny_v1"
-        device.firmware_version = "1.0.0"
-        device.battery_level = 85
-        device.connection_status = "online"
-        device.is_active = True
-        device.paired_at = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        device.child_id = mock_child.id
-        device.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        device.updated_at = None
-
-        mock_child.device = device
-
-        result = _convert_child_to_type(mock_child)
-
-        assert result.device is not None
-        assert result.device.serial_number == "ABC123"
-        assert result.device.battery_level == 85
-        assert result.device.connection_status.value == "online"
+        if device is None:
+            assert result.device is None
+        else:
+            assert result.device.serial_number == "ABC123"
+            assert result.device.battery_level == 85
+            assert result.device.connection_status.value == "online"
+            assert result.device.child_name == "홍아이"
 
 
 class TestConvertDeviceToType:
     """Tests for _convert_device_to_type function."""
 
-    @pytest.fixture
-    def mock_device(self):
-        """Create mock device model."""
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        device.serial_number = "DEV001"
-        device.device_type = "bunny_v2"
-        device.firmware_version = "2.0.0"
-        device.battery_level = 90
-        device.connection_status = "online"
-        device.is_active = True
-        device.paired_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
-        device.child_id = uuid.uuid4()
-        device.child = MagicMock()
-        device.child.name = "테스트아이"
-        device.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        device.updated_at = None
-        return device
-
-    def test_convert_device_basic(self, mock_device):
-        """Test basic device conversion."""
-        result = _convert_device_to_type(mock_device)
-
-        assert result.id == str(mock_device.id)
+    @pytest.mark.parametrize(
+        "child,child_id",
+        [
+            (SimpleNamespace(name="테스트아이"), _CHILD_ID),
+            (None, None),
+        ],
+        ids=["basic", "without_child"],
+    )
+    def test_convert_device(self, child, child_id):
+        """Test device conversion with and without a paired child."""
+        device = _make_device(
+            device_type="bunny_v2",
+            firmware_version="2.0.0",
+            child=child,
+            child_id=child_id,
+        )
+
+        result = _convert_device_to_type(device)
+
+        assert result.id == str(device.id)
         assert result.serial_number == "DEV001"
         assert result.device_type == "bunny_v2"
         assert result.firmware_version == "2.0.0"
         assert result.battery_level == 90
         assert result.connection_status.value == "online"
-        assert result.child_name == "테스트아이"
-
-    def test_convert_device_without_child(self, mock_device):
-        """Test device conversion without paired child."""
-        mock_device.child = None
-        mock_device.child_id = None
-
-        result = _convert_device_to_type(mock_device)
-
-        assert result.child_id is None
-        assert result.child_name is None
+        assert result.child_id == (str(child_id) if child_id else None)
+        assert result.child_name == (child.name if child else None)
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestUserQueries:
     """Tests for UserQueries resolver class."""
 
     @pytest.fixture
-    def mock_context(self, mock_db_session):
-        """Create mock GraphQL context."""
-        context = MagicMock()
-        context.user_id = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
-        context.user_email = "test@example.com"
-        context.user_name = "테스트"
-        context.db = mock_db_session
-        return context
+    def mock_info(self, mock_db_session):
+        """Create strawberry Info stand-in with an authenticated context."""
+        return FakeInfo(
+            FakeContext(
+                user_id=_USER_ID,
+                user_email="test@example.com",
+                user_name="테스트",
+                db=mock_db_session,
+            )
+        )
 
-    @pytest.fixture
-    def mock_info(self, mock_context):
-        """Create mock strawberry Info object."""
-        info = MagicMock()
-        info.context = mock_context
-        return info
-
-    @pytest.mark.anyio
-    async def test_me_authenticated(self, mock_info, mock_db_session):
+    async def test_me_authenticated(self, mock_info, user_profile_service_mock):
         """Test me query with authenticated user."""
-        from unittest.mock import AsyncMock
-        from app.services.user_profile_service import UserProfileResult
-
-        mock_profile = MagicMock()
-        mock_profile.user_id = "user_2NNEqL2nrIRdJ194ndJqAHwEfxC"
-        mock_profile.phone = None
-        mock_profile.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_profile.updated_at = None
-        mock_profile.children = []
-        mock_profile.subscription = None
-
-        mock_result = UserProfileResult(success=True, profile=mock_profile)
-
-        with patch("app.graphql.queries.user.UserProfileService") as MockService:
-            mock_service_instance = MagicMock()
-            mock_service_instance.get_or_create_profile = AsyncMock(return_value=mock_result)
-            MockService.return_value = mock_service_instance
-
-            queries = UserQueries()
-            result = await queries.me(mock_info)
+        mock_profile = _make_profile(phone=None, updated_at=None)
+        user_profile_service_mock.return_value.get_or_create_profile.return_value = (
+            UserProfileResult(success=True, profile=mock_profile)
+        )
 
-            assert result is not None
-            assert result.email == "test@example.com"
-            assert result.name == "테스트"
+        result = await _USER_QUERIES.me(mock_info)
 
-    @pytest.mark.anyio
-    async def test_me_unauthenticated(self, mock_info):
-        """Test me query without authentication."""
-        mock_info.context.user_id = None
-        mock_info.context.user_email = None
+        assert result is not None
+        assert result.email == "test@example.com"
+        assert result.name == "테스트"
 
-        queries = UserQueries()
-        result = await queries.me(mock_info)
+    async def test_my_children(self, mock_info):
+        """Test my_children query."""
+        child1 = _make_child(name="첫째", birth_date=date(2019, 1, 1), age=5)
+        child2 = _make_child(
+            name="둘째", birth_date=date(2021, 6, 1), gender="female", age=3
+        )
 
-        assert result is None
+        mock_info.context.db = FakeSession(FakeResult([child1, child2]))
 
-    @pytest.mark.anyio
-    async def test_my_children(self, mock_info, mock_db_session):
-        """Test my_children query."""
-        child1 = MagicMock()
-        child1.id = uuid.uuid4()
-        child1.name = "첫째"
-        child1.birth_date = date(2019, 1, 1)
-        child1.gender = "male"
-        child1.age = 5
-        child1.is_active = True
-        child1.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child1.updated_at = None
-        child1.device = None
-
-        child2 = MagicMock()
-        child2.id = uuid.uuid4()
-        child2.name = "둘째"
-        child2.birth_date = date(2021, 6, 1)
-        child2.gender = "female"
-        child2.age = 3
-        child2.is_active = True
-        child2.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        child2.updated_at = None
-        child2.device = None
-
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [child1, child2]
-        mock_db_session.execute.return_value = mock_result
-
-        queries = UserQueries()
-        result = await queries.my_children(mock_info)
+        result = await _USER_QUERIES.my_children(mock_info)
 
         assert len(result) == 2
         assert result[0].name == "첫째"
         assert result[1].name == "둘째"
 
-    @pytest.mark.anyio
-    async def test_my_children_unauthenticated(self, mock_info):
-        """Test my_children query without authentication."""
-        mock_info.context.user_id = None
-
-        queries = UserQueries()
-        result = await queries.my_children(mock_info)
+    async def test_my_subscription(self, mock_info):
+        """Test my_subscription query."""
+        mock_sub = _make_subscription(plan_type="basic", auto_renew=False)
 
-        assert result == []
+        mock_info.context.db = FakeSession(FakeResult(mock_sub))
 
-    @pytest.mark.anyio
-    async def test_my_subscription(self, mock_info, mock_db_session):
-        """Test my_subscription query."""
-        mock_sub = MagicMock()
-        mock_sub.id = uuid.uuid4()
-        mock_sub.plan_type = "basic"
-        mock_sub.status = "active"
-        mock_sub.started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_sub.expires_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        mock_sub.auto_renew = False
-        mock_sub.is_expired = False
-        mock_sub.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        mock_sub.updated_at = None
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_sub
-        mock_db_session.execute.return_value = mock_result
-
-        queries = UserQueries()
-        result = await queries.my_subscription(mock_info)
+        result = await _USER_QUERIES.my_subscription(mock_info)
 
         assert result is not None
         assert result.plan_type.value == "basic"
         assert result.is_expired is False
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestDeviceQueries:
     """Tests for DeviceQueries resolver class."""
 
     @pytest.fixture
-    def mock_context(self, mock_db_session):
-        """Create mock GraphQL context."""
-        context = MagicMock()
-        context.user_id = str(uuid.uuid4())
-        context.db = mock_db_session
-        return context
+    def mock_info(self, mock_db_session):
+        """Create strawberry Info stand-in with an authenticated context."""
+        return FakeInfo(FakeContext(user_id=_USER_ID, db=mock_db_session))
 
-    @pytest.fixture
-    def mock_info(self, mock_context):
-        """Create mock strawberry Info object."""
-        info = MagicMock()
-        info.context = mock_context
-        return info
-
-    @pytest.mark.anyio
-    async def test_my_devices(self, mock_info, mock_db_session):
+    async def test_my_devices(self, mock_info):
         """Test my_devices query."""
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        device.serial_number = "TEST001"
-        device.device_type = "bunny_v1"
-        device.firmware_version = "1.0.0"
-        device.battery_level = 75
-        device.connection_status = "online"
-        device.is_active = True
-        device.paired_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
-        device.child_id = uuid.uuid4()
-        device.child = MagicMock()
-        device.child.name = "테스트아이"
-        device.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        device.updated_at = None
-
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [device]
-        mock_db_session.execute.return_value = mock_result
-
-        queries = DeviceQueries()
-        result = await queries.my_devices(mock_info)
+        device = _make_device(
+            serial_number="TEST001",
+            battery_level=75,
+            child=SimpleNamespace(name="테스트아이"),
+        )
+
+        mock_info.context.db = FakeSession(FakeResult([device]))
+
+        result = await _DEVICE_QUERIES.my_devices(mock_info)
 
         assert len(result) == 1
         assert result[0].serial_number == "TEST001"
         assert result[0].battery_level == 75
 
-    @pytest.mark.anyio
-    async def test_my_devices_unauthenticated(self, mock_info):
-        """Test my_devices query without authentication."""
-        mock_info.context.user_id = None
-
-        queries = DeviceQueries()
-        result = await queries.my_devices(mock_info)
+    async def test_device_by_id(self, mock_info):
+        """Test device query by ID."""
+        device = _make_device(
+            serial_number="SINGLE001",
+            device_type="bunny_v2",
+            firmware_version="2.0.0",
+            battery_level=100,
+            connection_status="offline",
+            child=SimpleNamespace(name="아이이름"),
+        )
 
-        assert result == []
+        mock_info.context.db = FakeSession(FakeResult(device))
 
-    @pytest.mark.anyio
-    async def test_device_by_id(self, mock_info, mock_db_session):
-        """Test device query by ID."""
-        device_id = uuid.uuid4()
-
-        device = MagicMock()
-        device.id = device_id
-        device.serial_number = "SINGLE001"
-        device.device_type = "bunny_v2"
-        device.firmware_version = "2.0.0"
-        device.battery_level = 100
-        device.connection_status = "offline"
-        device.is_active = True
-        device.paired_at = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        device.child_id = uuid.uuid4()
-        device.child = MagicMock()
-        device.child.name = "아이이름"
-        device.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        device.updated_at = None
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = device
-        mock_db_session.execute.return_value = mock_result
-
-        queries = DeviceQueries()
-        result = await queries.device(mock_info, str(device_id))
+        result = await _DEVICE_QUERIES.device(mock_info, str(_DEVICE_ID))
 
         assert result is not None
         assert result.serial_number == "SINGLE001"
         assert result.connection_status.value == "offline"
 
-    @pytest.mark.anyio
-    async def test_device_not_found(self, mock_info, mock_db_session):
+    async def test_device_not_found(self, mock_info):
         """Test device query when device doesn't exist."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db_session.execute.return_value = mock_result
+        mock_info.context.db = FakeSession(FakeResult(None))
 
-        queries = DeviceQueries()
-        result = await queries.device(mock_info, str(uuid.uuid4()))
+        result = await _DEVICE_QUERIES.device(mock_info, str(_DEVICE_ID))
 
         assert result is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestUnauthenticatedQueries:
+    """Resolvers return an empty result when no user is authenticated."""
+
+    @pytest.fixture
+    def mock_info(self):
+        """Create strawberry Info stand-in without a user."""
+        return FakeInfo(FakeContext())
+
+    @pytest.mark.parametrize(
+        "resolver,method_name,expected",
+        [
+            (_USER_QUERIES, "me", None),
+            (_USER_QUERIES, "my_children", []),
+            (_USER_QUERIES, "my_subscription", None),
+            (_DEVICE_QUERIES, "my_devices", []),
+        ],
+        ids=["me", "my_children", "my_subscription", "my_devices"],
+    )
+    async def test_resolver_unauthenticated(
+        self, mock_info, resolver, method_name, expected
+    ):
+        """Test resolver short-circuits without authentication."""
+        result = await getattr(resolver, method_name)(mock_info)
+
+        assert result == expected
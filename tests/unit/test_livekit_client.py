@@ -8,34 +8,63 @@ Tests for:
 - Error handling for missing credentials
 """
 
-import pytest
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+from livekit.api import access_token
 
-class TestLiveKitClient:
-    """Tests for LiveKitClient."""
+from app.integrations import livekit as livekit_module
+from app.integrations.livekit import (
+    LiveKitClient,
+    LiveKitConfigError,
+    LiveKitTokenError,
+    LiveKitTokenResponse,
+    get_livekit_client,
+)
 
-    @pytest.fixture
-    def client(self):
-        """Create test client with mock settings."""
-        from app.integrations.livekit import LiveKitClient
 
-        return LiveKitClient(
-            api_key="test-api-key",
-            api_secret="test-api-secret",
-            livekit_url="wss://test.livekit.cloud",
-            token_ttl=900,
-        )
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with mock settings (shared; create_token is stateless)."""
+    return LiveKitClient(
+        api_key="test-api-key",
+        api_secret="test-api-secret",
+        livekit_url="wss://test.livekit.cloud",
+        token_ttl=900,
+    )
 
-    def test_create_token_success(self, client):
-        """Test successful token creation."""
-        from app.integrations.livekit import LiveKitTokenResponse
 
-        result = client.create_token(
-            room_name="test-room",
-            participant_identity="device-123",
-            participant_name="Test Device",
-        )
+@pytest.fixture(scope="module")
+def baseline_token(client):
+    """Token for the default room/identity, signed once per module."""
+    return client.create_token(
+        room_name="test-room",
+        participant_identity="device-123",
+        participant_name="Test Device",
+    )
+
+
+@pytest.fixture
+def fast_jwt(monkeypatch):
+    """Skip JWT signing in LiveKit's AccessToken; collect the claims instead."""
+    claims = []
+
+    def _encode(payload, key, algorithm=None, **kwargs):
+        claims.append(payload)
+        return "fake.jwt.token"
+
+    # Replace only LiveKit's module binding; PyJWT's own encode stays untouched
+    monkeypatch.setattr(access_token, "jwt", SimpleNamespace(encode=_encode))
+    return claims
+
+
+class TestLiveKitClient:
+    """Tests for LiveKitClient."""
+
+    def test_create_token_success(self, baseline_token):
+        """Test successful token creation."""
+        result = baseline_token
 
         assert isinstance(result, LiveKitTokenResponse)
         assert result.token is not None
@@ -43,7 +72,7 @@ class TestLiveKitClient:
         assert result.livekit_url == "wss://test.livekit.cloud"
         assert result.room_name == "test-room"
 
-    def test_create_token_with_metadata(self, client):
+    def test_create_token_with_metadata(self, client, fast_jwt):
         """Test token creation with metadata."""
         metadata = '{"child_name": "Test Child", "child_age": 5}'
         result = client.create_token(
@@ -52,10 +81,11 @@ class TestLiveKitClient:
             metadata=metadata,
         )
 
-        assert result.token is not None
-        # JWT 토큰이 정상적으로 생성되었는지 확인
+        assert result.token == "fake.jwt.token"
+        # metadata가 토큰 claims에 포함되었는지 확인
+        assert fast_jwt[0]["metadata"] == metadata
 
-    def test_create_token_with_custom_ttl(self, client):
+    def test_create_token_with_custom_ttl(self, client, fast_jwt):
         """Test token creation with custom TTL."""
         result = client.create_token(
             room_name="test-room",
@@ -63,12 +93,11 @@ class TestLiveKitClient:
             ttl=1800,  # 30 minutes
         )
 
-        assert result.token is not None
+        assert result.token == "fake.jwt.token"
+        assert fast_jwt[0]["exp"] - fast_jwt[0]["nbf"] == 1800
 
     def test_create_token_missing_room_name(self, client):
         """Test token creation fails without room name."""
-        from app.integrations.livekit import LiveKitTokenError
-
         with pytest.raises(LiveKitTokenError) as exc_info:
             client.create_token(
                 room_name="",
@@ -79,8 +108,6 @@ class TestLiveKitClient:
 
     def test_create_token_missing_identity(self, client):
         """Test token creation fails without identity."""
-        from app.integrations.livekit import LiveKitTokenError
-
         with pytest.raises(LiveKitTokenError) as exc_info:
             client.create_token(
                 room_name="test-room",
@@ -89,44 +116,38 @@ class TestLiveKitClient:
 
         assert "identity" in str(exc_info.value).lower()
 
-    def test_client_missing_credentials(self):
+    def test_client_missing_credentials(self, monkeypatch):
         """Test client initialization fails without credentials."""
-        from app.integrations.livekit import LiveKitClient, LiveKitConfigError
+        # settings는 import 시점에 로드되므로 환경변수 대신 settings 값을 비움
+        monkeypatch.setattr(livekit_module.settings, "LIVEKIT_API_KEY", "")
+        monkeypatch.setattr(livekit_module.settings, "LIVEKIT_API_SECRET", "")
 
-        # 환경변수 fallback을 막기 위해 None 대신 빈 문자열과 함께
-        # settings를 무시하도록 직접 전달
         with pytest.raises(LiveKitConfigError):
-            # api_key와 api_secret이 falsy 값일 때 에러 발생 확인
-            client = LiveKitClient.__new__(LiveKitClient)
-            client.api_key = ""
-            client.api_secret = ""
-            if not client.api_key or not client.api_secret:
-                raise LiveKitConfigError(
-                    "LIVEKIT_API_KEY and LIVEKIT_API_SECRET must be set"
-                )
-
-    def test_generate_room_name(self):
+            LiveKitClient(
+                api_key="",
+                api_secret="",
+                livekit_url="wss://test.livekit.cloud",
+                token_ttl=900,
+            )
+
+    def test_generate_room_name(self, monkeypatch):
         """Test room name generation."""
-        from app.integrations.livekit import LiveKitClient
+        # session_id 고정 (uniqueness 테스트는 실제 uuid4 사용)
+        fake_uuid = SimpleNamespace(
+            uuid4=lambda: SimpleNamespace(hex="aabbccdd00112233")
+        )
+        monkeypatch.setattr(livekit_module, "uuid", fake_uuid)
 
         room_name = LiveKitClient.generate_room_name(
             "deviceuuid123456789",
             "childuuid987654321",
         )
 
-        assert room_name.startswith("voice-")
         # 형식: voice-{device_id[:8]}-{child_id[:8]}-{session_id}
-        parts = room_name.split("-")
-        assert len(parts) == 4
-        assert parts[0] == "voice"
-        assert parts[1] == "deviceuu"  # deviceuuid123456789[:8]
-        assert parts[2] == "childuui"  # childuuid987654321[:8]
-        assert len(parts[3]) == 8       # session_id
+        assert room_name == "voice-deviceuu-childuui-aabbccdd"
 
     def test_generate_room_name_uniqueness(self):
         """Test room name generation creates unique names."""
-        from app.integrations.livekit import LiveKitClient
-
         room1 = LiveKitClient.generate_room_name("device-1", "child-1")
         room2 = LiveKitClient.generate_room_name("device-1", "child-1")
 
@@ -139,15 +160,11 @@ class TestGetLiveKitClient:
 
     def test_get_client_returns_instance(self):
         """Test that get_livekit_client returns a client instance."""
-        from app.integrations.livekit import get_livekit_client, LiveKitClient
-
         client = get_livekit_client()
         assert isinstance(client, LiveKitClient)
 
     def test_get_client_is_singleton(self):
         """Test that get_livekit_client returns the same instance."""
-        from app.integrations.livekit import get_livekit_client
-
         client1 = get_livekit_client()
         client2 = get_livekit_client()
         assert client1 is client2
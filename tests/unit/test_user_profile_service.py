@@ -11,146 +11,119 @@ UserProfileService unit tests.
 2. 정상: 프로필 없으면 자동 생성 후 업데이트
 """
 
-import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
-from app.models.user_profile import UserProfile
 from app.services.user_profile_service import UserProfileResult, UserProfileService
+from tests.helpers import aret, fake_uuid
 
 
-@pytest.fixture
-def mock_db_session():
-    """Mock database session."""
-    session = AsyncMock()
-    session.flush = AsyncMock()
-    session.refresh = AsyncMock()
-    return session
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_profile():
-    """Create a sample user profile for testing."""
-    profile = MagicMock(spec=UserProfile)
-    profile.user_id = uuid.uuid4()
-    profile.phone = "010-1234-5678"
-    profile.created_at = datetime.now(timezone.utc)
-    profile.updated_at = datetime.now(timezone.utc)
-    profile.children = []
-    profile.subscription = None
-    return profile
+    """Create a sample user profile for testing (read-only, shared)."""
+    return SimpleNamespace(
+        user_id=fake_uuid(),
+        phone="010-1234-5678",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        children=[],
+        subscription=None,
+    )
 
 
 class TestGetOrCreateProfile:
     """get_or_create_profile 테스트."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_profile(self, mock_db_session, sample_profile):
+    async def test_get_existing_profile(
+        self, monkeypatch, mock_db_session, sample_profile
+    ):
         """기존 프로필 조회 성공."""
         service = UserProfileService(mock_db_session)
+        monkeypatch.setattr(
+            service.profile_repo, "get_or_create", aret(sample_profile)
+        )
 
-        with patch.object(
-            service.profile_repo, "get_or_create", new_callable=AsyncMock
-        ) as mock_get_or_create:
-            mock_get_or_create.return_value = sample_profile
-
-            result = await service.get_or_create_profile(
-                user_id=sample_profile.user_id,
-            )
+        result = await service.get_or_create_profile(
+            user_id=sample_profile.user_id,
+        )
 
-            assert result.success is True
-            assert result.profile is not None
-            assert result.profile.user_id == sample_profile.user_id
+        assert result.success is True
+        assert result.profile is not None
+        assert result.profile.user_id == sample_profile.user_id
 
     @pytest.mark.asyncio
-    async def test_create_new_profile(self, mock_db_session):
+    async def test_create_new_profile(self, monkeypatch, mock_db_session):
         """신규 프로필 자동 생성."""
         service = UserProfileService(mock_db_session)
-        new_user_id = uuid.uuid4()
+        new_user_id = fake_uuid()
 
-        new_profile = MagicMock(spec=UserProfile)
-        new_profile.user_id = new_user_id
-        new_profile.phone = None
-        new_profile.children = []
-        new_profile.subscription = None
+        new_profile = SimpleNamespace(
+            user_id=new_user_id,
+            phone=None,
+            children=[],
+            subscription=None,
+        )
+        monkeypatch.setattr(service.profile_repo, "get_or_create", aret(new_profile))
 
-        with patch.object(
-            service.profile_repo, "get_or_create", new_callable=AsyncMock
-        ) as mock_get_or_create:
-            mock_get_or_create.return_value = new_profile
+        result = await service.get_or_create_profile(
+            user_id=new_user_id,
+        )
 
-            result = await service.get_or_create_profile(
-                user_id=new_user_id,
-            )
-
-            assert result.success is True
-            assert result.profile.user_id == new_user_id
+        assert result.success is True
+        assert result.profile.user_id == new_user_id
 
 
 class TestUpdateProfile:
     """update_profile 테스트."""
 
     @pytest.mark.asyncio
-    async def test_update_phone_success(self, mock_db_session, sample_profile):
+    async def test_update_phone_success(
+        self, monkeypatch, mock_db_session, sample_profile
+    ):
         """전화번호 업데이트 성공."""
         service = UserProfileService(mock_db_session)
+        updated_profile = SimpleNamespace(phone="010-9999-8888")
+        monkeypatch.setattr(
+            service.profile_repo, "get_by_user_id", aret(sample_profile)
+        )
+        monkeypatch.setattr(service.profile_repo, "update", aret(updated_profile))
 
-        with patch.object(
-            service.profile_repo, "get_by_user_id", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = sample_profile
-
-            with patch.object(
-                service.profile_repo, "update", new_callable=AsyncMock
-            ) as mock_update:
-                updated_profile = MagicMock(spec=UserProfile)
-                updated_profile.phone = "010-9999-8888"
-                mock_update.return_value = updated_profile
-
-                result = await service.update_profile(
-                    user_id=sample_profile.user_id,
-                    phone="010-9999-8888",
-                )
+        result = await service.update_profile(
+            user_id=sample_profile.user_id,
+            phone="010-9999-8888",
+        )
 
-                assert result.success is True
-                assert result.profile.phone == "010-9999-8888"
+        assert result.success is True
+        assert result.profile.phone == "010-9999-8888"
 
     @pytest.mark.asyncio
-    async def test_update_creates_profile_if_not_exists(self, mock_db_session):
+    async def test_update_creates_profile_if_not_exists(
+        self, monkeypatch, mock_db_session
+    ):
         """프로필 없으면 자동 생성 후 업데이트."""
         service = UserProfileService(mock_db_session)
         new_user_id = "user_new123"
 
-        with patch.object(
-            service.profile_repo, "get_by_user_id", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = None
-
-            new_profile = MagicMock(spec=UserProfile)
-            new_profile.user_id = new_user_id
-            new_profile.phone = None
-
-            with patch.object(
-                service.profile_repo, "get_or_create", new_callable=AsyncMock
-            ) as mock_create:
-                mock_create.return_value = new_profile
-
-                updated_profile = MagicMock(spec=UserProfile)
-                updated_profile.user_id = new_user_id
-                updated_profile.phone = "010-1234-5678"
-
-                with patch.object(
-                    service.profile_repo, "update", new_callable=AsyncMock
-                ) as mock_update:
-                    mock_update.return_value = updated_profile
-
-                    result = await service.update_profile(
-                        user_id=new_user_id,
-                        phone="010-1234-5678",
-                    )
-
-                    mock_create.assert_called_once_with(user_id=new_user_id)
-                    assert result.success is True
-                    assert result.profile.phone == "010-1234-5678"
+        new_profile = SimpleNamespace(user_id=new_user_id, phone=None)
+        updated_profile = SimpleNamespace(
+            user_id=new_user_id,
+            phone="010-1234-5678",
+        )
+        # Keep an AsyncMock reference for the call assertion below
+        mock_create = AsyncMock(return_value=new_profile)
+        monkeypatch.setattr(service.profile_repo, "get_by_user_id", aret(None))
+        monkeypatch.setattr(service.profile_repo, "get_or_create", mock_create)
+        monkeypatch.setattr(service.profile_repo, "update", aret(updated_profile))
+
+        result = await service.update_profile(
+            user_id=new_user_id,
+            phone="010-1234-5678",
+        )
+
+        mock_create.assert_called_once_with(user_id=new_user_id)
+        assert result.success is True
+        assert result.profile.phone == "010-1234-5678"
@@ -2,396 +2,312 @@
 Unit tests for VoiceTokenService.
 """
 
-import uuid
-from datetime import date, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.integrations.livekit import LiveKitTokenError, LiveKitTokenResponse
-from app.services.voice_token_service import VoiceTokenService, TokenResult
+from app.services import voice_token_service as voice_token_module
+from app.services.voice_token_service import VoiceTokenService
+from tests.helpers import fake_uuid
 
+# Everything here is mocked, so tests can share one event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-class TestVoiceTokenService:
-    """Tests for VoiceTokenService."""
+# IDs are opaque to the service; generate them once and reuse across tests.
+USER_ID = fake_uuid()
+CHILD_ID = fake_uuid()
+DEVICE_ID = fake_uuid()
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create mock database session."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_redis(self):
-        """Create mock Redis client."""
-        redis = AsyncMock()
-        redis.get = AsyncMock(return_value=None)
-        redis.incr = AsyncMock()
-        redis.ttl = AsyncMock(return_value=-1)
-        redis.expire = AsyncMock()
-        return redis
-
-    @pytest.fixture
-    def mock_child(self):
-        """Create mock child object."""
-        child = MagicMock()
-        child.id = uuid.uuid4()
-        child.name = "테스트"
-        child.is_active = True
-        child.user_id = uuid.uuid4()
-        child.birth_date = date(2020, 1, 1)
-        child.age = 5
-        child.personality_traits = {"traits": ["curious", "energetic"]}
-        return child
-
-    @pytest.fixture
-    def mock_device(self, mock_child):
-        """Create mock device object."""
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        device.serial_number = "ABC123"
-        device.child_id = mock_child.id
-        device.child = mock_child
-        device.is_active = True
-        device.last_seen = None
-        device.connection_status = "offline"
-        return device
-
-    @pytest.fixture
-    def mock_subscription(self):
-        """Create mock subscription object."""
-        subscription = MagicMock()
-        subscription.user_id = uuid.uuid4()
-        subscription.plan_type = "basic"
-        subscription.status = "active"
-        subscription.is_expired = False
-        return subscription
-
-    @pytest.mark.asyncio
-    async def test_generate_token_success(
-        self, mock_db, mock_redis, mock_device, mock_subscription
-    ):
-        """Test successful token generation."""
-        service = VoiceTokenService(mock_db, mock_redis)
-
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ), patch(
-            "app.services.voice_token_service.get_livekit_client"
-        ) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.create_token = MagicMock(
-                return_value=LiveKitTokenResponse(
-                    token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
-                    livekit_url="wss://test.livekit.cloud",
-                    room_name="voice-test-room",
-                )
-            )
-            mock_get_client.return_value = mock_client
-
-            result = await service.generate_token(mock_device)
-
-            assert result.success is True
-            assert result.token == "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test"
-            assert result.livekit_url == "wss://test.livekit.cloud"
-            assert result.room_name == "voice-test-room"
-            assert result.child_context is not None
-            assert result.child_context.child_name == "테스트"
-            assert result.child_context.child_age == 5
-
-    @pytest.mark.asyncio
-    async def test_generate_token_device_not_paired(self, mock_db, mock_redis):
-        """Test token generation fails for unpaired device."""
-        device = MagicMock()
-        device.child_id = None  # Not paired
-
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service.generate_token(device)
+# LiveKit response shared by the success-path tests (read-only)
+TOKEN_OK = LiveKitTokenResponse(
+    token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
+    livekit_url="wss://test.livekit.cloud",
+    room_name="voice-test-room",
+)
 
-        assert result.success is False
-        assert result.error_code == "DEVICE_NOT_PAIRED"
 
-    @pytest.mark.asyncio
-    async def test_generate_token_child_inactive(
-        self, mock_db, mock_redis, mock_device
-    ):
-        """Test token generation fails for inactive child."""
-        mock_device.child.is_active = False
+# Failure cases for generate_token: each arranges one broken precondition on
+# (device, stubs, redis) starting from the valid fixtures.
+def _unpair_device(device, stubs, redis):
+    device.child_id = None
 
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service.generate_token(mock_device)
 
-        assert result.success is False
-        assert result.error_code == "CHILD_NOT_FOUND"
+def _deactivate_child(device, stubs, redis):
+    device.child.is_active = False
 
-    @pytest.mark.asyncio
-    async def test_generate_token_child_none(self, mock_db, mock_redis, mock_device):
-        """Test token generation fails when child is None."""
-        mock_device.child = None
 
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service.generate_token(mock_device)
+def _remove_child(device, stubs, redis):
+    device.child = None
 
-        assert result.success is False
-        assert result.error_code == "CHILD_NOT_FOUND"
 
-    @pytest.mark.asyncio
-    async def test_generate_token_subscription_not_found(
-        self, mock_db, mock_redis, mock_device
-    ):
-        """Test token generation fails when subscription not found."""
-        service = VoiceTokenService(mock_db, mock_redis)
+def _remove_subscription(device, stubs, redis):
+    stubs.subscription = None
 
-        with patch.object(service, "_get_subscription", return_value=None):
-            result = await service.generate_token(mock_device)
 
-            assert result.success is False
-            assert result.error_code == "SUBSCRIPTION_NOT_FOUND"
+def _cancel_subscription(device, stubs, redis):
+    stubs.subscription.status = "cancelled"
 
-    @pytest.mark.asyncio
-    async def test_generate_token_subscription_inactive(
-        self, mock_db, mock_redis, mock_device, mock_subscription
-    ):
-        """Test token generation fails for inactive subscription."""
-        mock_subscription.status = "cancelled"
 
-        service = VoiceTokenService(mock_db, mock_redis)
+def _expire_subscription(device, stubs, redis):
+    stubs.subscription.is_expired = True
 
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ):
-            result = await service.generate_token(mock_device)
 
-            assert result.success is False
-            assert result.error_code == "SUBSCRIPTION_INACTIVE"
+def _exhaust_rate_limit(device, stubs, redis):
+    redis.get.return_value = "200"  # At limit for basic plan
 
-    @pytest.mark.asyncio
-    async def test_generate_token_subscription_expired(
-        self, mock_db, mock_redis, mock_device, mock_subscription
-    ):
-        """Test token generation fails for expired subscription."""
-        mock_subscription.is_expired = True
 
-        service = VoiceTokenService(mock_db, mock_redis)
+def _fail_livekit(device, stubs, redis):
+    stubs.client = MagicMock()
+    stubs.client.create_token = MagicMock(
+        side_effect=LiveKitTokenError("Token generation failed")
+    )
+
+
+FAILURE_CASES = [
+    pytest.param(_unpair_device, "DEVICE_NOT_PAIRED", id="device_not_paired"),
+    pytest.param(_deactivate_child, "CHILD_NOT_FOUND", id="child_inactive"),
+    pytest.param(_remove_child, "CHILD_NOT_FOUND", id="child_none"),
+    pytest.param(
+        _remove_subscription, "SUBSCRIPTION_NOT_FOUND", id="subscription_not_found"
+    ),
+    pytest.param(
+        _cancel_subscription, "SUBSCRIPTION_INACTIVE", id="subscription_inactive"
+    ),
+    pytest.param(
+        _expire_subscription, "SUBSCRIPTION_INACTIVE", id="subscription_expired"
+    ),
+    pytest.param(_exhaust_rate_limit, "RATE_LIMIT_EXCEEDED", id="rate_limit_exceeded"),
+    pytest.param(_fail_livekit, "LIVEKIT_ERROR", id="livekit_error"),
+]
+
+
+@pytest.fixture
+def mock_db():
+    """Create mock database session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_child():
+    """Create mock child object."""
+    return SimpleNamespace(
+        id=CHILD_ID,
+        name="테스트",
+        is_active=True,
+        user_id=USER_ID,
+        birth_date=date(2020, 1, 1),
+        age=5,
+        personality_traits={"traits": ["curious", "energetic"]},
+    )
+
+
+@pytest.fixture
+def mock_device(mock_child):
+    """Create mock device object."""
+    return SimpleNamespace(
+        id=DEVICE_ID,
+        serial_number="ABC123",
+        child_id=mock_child.id,
+        child=mock_child,
+        is_active=True,
+        last_seen=None,
+        connection_status="offline",
+    )
+
+
+@pytest.fixture
+def mock_subscription():
+    """Create mock subscription object."""
+    return SimpleNamespace(
+        user_id=USER_ID,
+        plan_type="basic",
+        status="active",
+        is_expired=False,
+    )
+
 
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ):
-            result = await service.generate_token(mock_device)
+@pytest.fixture
+def livekit_client_ok():
+    """LiveKit client whose create_token succeeds with TOKEN_OK."""
+    client = MagicMock()
+    client.create_token = MagicMock(return_value=TOKEN_OK)
+    return client
 
-            assert result.success is False
-            assert result.error_code == "SUBSCRIPTION_INACTIVE"
 
-    @pytest.mark.asyncio
-    async def test_generate_token_rate_limit_exceeded(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+@pytest.fixture
+def patched_service(monkeypatch, mock_db, mock_redis_client):
+    """
+    VoiceTokenService with its subscription lookup and LiveKit client stubbed.
+
+    Tests set ``stubs.subscription`` / ``stubs.client`` before calling
+    generate_token.
+    """
+    stubs = SimpleNamespace(subscription=None, client=None)
+
+    async def _get_subscription(self, user_id):
+        return stubs.subscription
+
+    monkeypatch.setattr(VoiceTokenService, "_get_subscription", _get_subscription)
+    monkeypatch.setattr(
+        voice_token_module, "get_livekit_client", lambda: stubs.client
+    )
+    return VoiceTokenService(mock_db, mock_redis_client), stubs
+
+
+@pytest.fixture
+def free_subscription(mock_subscription):
+    """Active subscription on the free plan (50 calls/day)."""
+    mock_subscription.plan_type = "free"
+    return mock_subscription
+
+
+class TestVoiceTokenService:
+    """Tests for VoiceTokenService."""
+
+    async def test_generate_token_success(
+        self, patched_service, mock_device, mock_subscription, livekit_client_ok
     ):
-        """Test token generation fails when rate limit exceeded."""
-        mock_redis.get = AsyncMock(return_value="200")  # At limit for basic plan
+        """Test successful token generation."""
+        service, stubs = patched_service
+        stubs.subscription = mock_subscription
+        stubs.client = livekit_client_ok
+
+        result = await service.generate_token(mock_device)
 
-        service = VoiceTokenService(mock_db, mock_redis)
+        assert result.success is True
+        assert result.token == "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test"
+        assert result.livekit_url == "wss://test.livekit.cloud"
+        assert result.room_name == "voice-test-room"
+        assert result.child_context is not None
+        assert result.child_context.child_name == "테스트"
+        assert result.child_context.child_age == 5
+
+    @pytest.mark.parametrize(("arrange", "expected_code"), FAILURE_CASES)
+    async def test_generate_token_failure(
+        self,
+        patched_service,
+        mock_redis_client,
+        mock_device,
+        mock_subscription,
+        arrange,
+        expected_code,
+    ):
+        """Test each validation step rejects the request with its error code."""
+        service, stubs = patched_service
+        stubs.subscription = mock_subscription
+        arrange(mock_device, stubs, mock_redis_client)
 
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ):
-            result = await service.generate_token(mock_device)
+        result = await service.generate_token(mock_device)
 
-            assert result.success is False
-            assert result.error_code == "RATE_LIMIT_EXCEEDED"
+        assert result.success is False
+        assert result.error_code == expected_code
 
-    @pytest.mark.asyncio
     async def test_generate_token_premium_unlimited(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+        self,
+        patched_service,
+        mock_redis_client,
+        mock_device,
+        mock_subscription,
+        livekit_client_ok,
     ):
         """Test premium users bypass rate limit."""
         mock_subscription.plan_type = "premium"
-        mock_redis.get = AsyncMock(return_value="10000")  # High usage
-
-        service = VoiceTokenService(mock_db, mock_redis)
-
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ), patch(
-            "app.services.voice_token_service.get_livekit_client"
-        ) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.create_token = MagicMock(
-                return_value=LiveKitTokenResponse(
-                    token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
-                    livekit_url="wss://test.livekit.cloud",
-                    room_name="voice-test-room",
-                )
-            )
-            mock_get_client.return_value = mock_client
-
-            result = await service.generate_token(mock_device)
-
-            assert result.success is True
-
-    @pytest.mark.asyncio
-    async def test_generate_token_livekit_error(
-        self, mock_db, mock_redis, mock_device, mock_subscription
-    ):
-        """Test token generation fails when LiveKit API fails."""
-        service = VoiceTokenService(mock_db, mock_redis)
-
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ), patch(
-            "app.services.voice_token_service.get_livekit_client"
-        ) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.create_token = MagicMock(
-                side_effect=LiveKitTokenError("Token generation failed")
-            )
-            mock_get_client.return_value = mock_client
-
-            result = await service.generate_token(mock_device)
-
-            assert result.success is False
-            assert result.error_code == "LIVEKIT_ERROR"
-
-    @pytest.mark.asyncio
+        mock_redis_client.get.return_value = "10000"  # High usage
+        service, stubs = patched_service
+        stubs.subscription = mock_subscription
+        stubs.client = livekit_client_ok
+
+        result = await service.generate_token(mock_device)
+
+        assert result.success is True
+
     async def test_generate_token_without_redis(
-        self, mock_db, mock_device, mock_subscription
+        self, patched_service, mock_device, mock_subscription, livekit_client_ok
     ):
         """Test token generation works without Redis (no rate limiting)."""
-        service = VoiceTokenService(mock_db, redis=None)
-
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ), patch(
-            "app.services.voice_token_service.get_livekit_client"
-        ) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.create_token = MagicMock(
-                return_value=LiveKitTokenResponse(
-                    token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
-                    livekit_url="wss://test.livekit.cloud",
-                    room_name="voice-test-room",
-                )
-            )
-            mock_get_client.return_value = mock_client
-
-            result = await service.generate_token(mock_device)
-
-            assert result.success is True
-
-    @pytest.mark.asyncio
+        service, stubs = patched_service
+        service.redis = None
+        stubs.subscription = mock_subscription
+        stubs.client = livekit_client_ok
+
+        result = await service.generate_token(mock_device)
+
+        assert result.success is True
+
     async def test_generate_token_empty_personality_traits(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+        self, patched_service, mock_device, mock_subscription, livekit_client_ok
     ):
         """Test token generation with empty personality traits."""
         mock_device.child.personality_traits = {}
+        service, stubs = patched_service
+        stubs.subscription = mock_subscription
+        stubs.client = livekit_client_ok
 
-        service = VoiceTokenService(mock_db, mock_redis)
-
-        with patch.object(
-            service, "_get_subscription", return_value=mock_subscription
-        ), patch(
-            "app.services.voice_token_service.get_livekit_client"
-        ) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.create_token = MagicMock(
-                return_value=LiveKitTokenResponse(
-                    token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
-                    livekit_url="wss://test.livekit.cloud",
-                    room_name="voice-test-room",
-                )
-            )
-            mock_get_client.return_value = mock_client
-
-            result = await service.generate_token(mock_device)
+        result = await service.generate_token(mock_device)
 
-            assert result.success is True
-            assert result.child_context.personality_traits == []
+        assert result.success is True
+        assert result.child_context.personality_traits == []
 
 
 class TestRateLimiting:
     """Tests for rate limiting logic."""
 
-    @pytest.fixture
-    def mock_db(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_redis(self):
-        redis = AsyncMock()
-        redis.get = AsyncMock()
-        redis.incr = AsyncMock()
-        redis.ttl = AsyncMock()
-        redis.expire = AsyncMock()
-        return redis
-
-    @pytest.fixture
-    def mock_device(self):
-        device = MagicMock()
-        device.id = uuid.uuid4()
-        return device
-
-    @pytest.fixture
-    def mock_subscription(self):
-        subscription = MagicMock()
-        subscription.plan_type = "free"
-        return subscription
-
-    @pytest.mark.asyncio
     async def test_check_rate_limit_under_limit(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+        self, mock_db, mock_redis_client, mock_device, free_subscription
     ):
         """Test rate limit check passes when under limit."""
-        mock_redis.get = AsyncMock(return_value="10")  # 10 calls, limit is 50
+        mock_redis_client.get.return_value = "10"  # 10 calls, limit is 50
 
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service._check_rate_limit(mock_device, mock_subscription)
+        service = VoiceTokenService(mock_db, mock_redis_client)
+        result = await service._check_rate_limit(mock_device, free_subscription)
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_check_rate_limit_at_limit(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+        self, mock_db, mock_redis_client, mock_device, free_subscription
     ):
         """Test rate limit check fails when at limit."""
-        mock_redis.get = AsyncMock(return_value="50")  # At limit
+        mock_redis_client.get.return_value = "50"  # At limit
 
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service._check_rate_limit(mock_device, mock_subscription)
+        service = VoiceTokenService(mock_db, mock_redis_client)
+        result = await service._check_rate_limit(mock_device, free_subscription)
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_check_rate_limit_no_previous_calls(
-        self, mock_db, mock_redis, mock_device, mock_subscription
+        self, mock_db, mock_redis_client, mock_device, free_subscription
     ):
         """Test rate limit check passes when no previous calls."""
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis_client.get.return_value = None
 
-        service = VoiceTokenService(mock_db, mock_redis)
-        result = await service._check_rate_limit(mock_device, mock_subscription)
+        service = VoiceTokenService(mock_db, mock_redis_client)
+        result = await service._check_rate_limit(mock_device, free_subscription)
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_increment_rate_limit_sets_expiry(
-        self, mock_db, mock_redis, mock_device
+        self, mock_db, mock_redis_client, mock_device
     ):
         """Test rate limit increment sets expiry on new key."""
-        mock_redis.ttl = AsyncMock(return_value=-1)  # No expiry
+        mock_redis_client.ttl.return_value = -1  # No expiry
 
-        service = VoiceTokenService(mock_db, mock_redis)
+        service = VoiceTokenService(mock_db, mock_redis_client)
         await service._increment_rate_limit(mock_device)
 
-        mock_redis.incr.assert_called_once()
-        mock_redis.expire.assert_called_once()
+        mock_redis_client.incr.assert_called_once()
+        mock_redis_client.expire.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_increment_rate_limit_preserves_expiry(
-        self, mock_db, mock_redis, mock_device
+        self, mock_db, mock_redis_client, mock_device
     ):
         """Test rate limit increment preserves existing expiry."""
-        mock_redis.ttl = AsyncMock(return_value=3600)  # 1 hour remaining
+        mock_redis_client.ttl.return_value = 3600  # 1 hour remaining
 
-        service = VoiceTokenService(mock_db, mock_redis)
+        service = VoiceTokenService(mock_db, mock_redis_client)
         await service._increment_rate_limit(mock_device)
 
-        mock_redis.incr.assert_called_once()
-        mock_redis.expire.assert_not_called()
+        mock_redis_client.incr.assert_called_once()
+        mock_redis_client.expire.assert_not_called()